@@ -1,5 +1,5 @@
 """Configuration module for RAG pipeline."""
 
-from .settings import settings
+from .settings import Settings, get_settings
 
-__all__ = ["settings"]
+__all__ = ["Settings", "get_settings"]
@@ -1,10 +1,16 @@
 """
 Configuration settings for the RAG-enabled AI Research Knowledge Hub.
 Loads environment variables and provides centralized configuration.
+
+Environment variables use the UPPER_CASE form of the field name (e.g.
+OPENAI_API_KEY for openai_api_key) and are matched case-sensitively.
 """
 
-from pydantic_settings import BaseSettings
+from functools import lru_cache
 from pathlib import Path
+from typing import Any
+
+from pydantic_settings import BaseSettings
 
 
 class Settings(BaseSettings):
@@ -16,12 +22,18 @@ class Settings(BaseSettings):
     openai_embedding_model: str = "text-embedding-3-large"
     openai_max_tokens: int = 4096
     openai_temperature: float = 0.7
+    generator_backend: str = "openai"  # "openai" or "langchain"
+    analysis_cache_path: str = "./data/analysis_cache.sqlite3"
+    embedding_cache_path: str = "./data/embedding_cache.sqlite3"
     
     # Qdrant Vector Database Configuration
     qdrant_url: str = "http://localhost:6333"
     qdrant_api_key: str = ""
+    qdrant_grpc_port: int = 6334
     qdrant_collection_name: str = "ai_research_knowledge"
     qdrant_vector_size: int = 3072
+    qdrant_upsert_batch_size: int = 64
+    bulk_ingest_mode: bool = False
     
     # API Configuration
     api_host: str = "0.0.0.0"
@@ -32,19 +44,43 @@ class Settings(BaseSettings):
     retrieval_top_k: int = 5
     chunk_size: int = 1000
     chunk_overlap: int = 200
+    doc_hash_algorithm: str = "md5"  # "md5" or "blake3"
     
     # Logging
     log_level: str = "INFO"
     log_file: str = "./logs/app.log"
     
     class Config:
-        env_file = ".env"
-        case_sensitive = False
-
+        # Resolve .env next to the project root rather than the working directory
+        env_file = Path(__file__).resolve().parent.parent / ".env"
+        case_sensitive = True
+        # Match only the UPPER_CASE variable name for each field
+        alias_generator = str.upper
+        # .env may hold variables for other tools (e.g. docker-compose)
+        extra = "ignore"
+    
+    def __init__(self, **values: Any):
+        # Keyword arguments use field names; map them to their UPPER_CASE
+        # aliases so they override the environment instead of being ignored
+        fields = type(self).model_fields
+        super().__init__(**{
+            name.upper() if name in fields else name: value
+            for name, value in values.items()
+        })
 
-# Global settings instance
-settings = Settings()
 
-# Ensure required directories exist
-Path("./logs").mkdir(parents=True, exist_ok=True)
-Path("./data/uploaded_documents").mkdir(parents=True, exist_ok=True)
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Return the process-wide settings instance.
+    
+    The first call creates the required directories; subsequent calls are a
+    cache lookup.
+    """
+    settings = Settings()
+    
+    # Ensure required directories exist (runs once per process)
+    Path(settings.log_file).parent.mkdir(parents=True, exist_ok=True)
+    Path("./data/uploaded_documents").mkdir(parents=True, exist_ok=True)
+    
+    return settings
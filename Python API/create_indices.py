@@ -0,0 +1,66 @@
+"""
+Create payload indexes on the doc_id fields in the Qdrant collection.
+
+This script creates keyword indexes on both the top-level 'doc_id' payload
+field (legacy format) and 'metadata.doc_id' (LangChain format) so that
+duplicate checks can filter without scanning all points.
+
+The API creates missing indexes at startup; run this script to add them to
+a collection without starting the API.
+"""
+
+from qdrant_client.models import PayloadSchemaType
+from config.settings import get_settings
+from src.clients.qdrant import DOC_ID_FIELDS, get_qdrant_client
+from loguru import logger
+
+
+def create_doc_id_indices():
+    """Create keyword indexes on all doc_id payload fields."""
+    settings = get_settings()
+    collection_name = settings.qdrant_collection_name
+    client = get_qdrant_client()
+    success = True
+    
+    for field in DOC_ID_FIELDS:
+        try:
+            logger.info(f"Creating payload index on '{field}' for collection '{collection_name}'...")
+            
+            # Keyword type for exact matching
+            client.create_payload_index(
+                collection_name=collection_name,
+                field_name=field,
+                field_schema=PayloadSchemaType.KEYWORD
+            )
+            
+            logger.info(f"✅ Successfully created payload index on '{field}'")
+        
+        except Exception as e:
+            logger.error(f"Error creating index on '{field}': {e}")
+            logger.info("If the index already exists, this is expected and you can ignore this error.")
+            success = False
+    
+    try:
+        # Verify indexes once all of them have been requested
+        collection_info = client.get_collection(collection_name)
+        logger.info(f"Payload schema: {collection_info.payload_schema}")
+    except Exception as e:
+        logger.error(f"Error fetching collection info: {e}")
+        success = False
+    
+    return success
+
+
+if __name__ == "__main__":
+    logger.info("=" * 60)
+    logger.info("Qdrant Payload Index Creation Script")
+    logger.info("=" * 60)
+    
+    success = create_doc_id_indices()
+    
+    if success:
+        logger.info("\n✨ Index creation completed successfully!")
+        logger.info("Your duplicate checks will now use the index for fast lookups.")
+    else:
+        logger.info("\n⚠️  Index creation encountered an issue.")
+        logger.info("Check the logs above for details.")
@@ -7,24 +7,53 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from typing import Optional, List
+from contextlib import asynccontextmanager
 import asyncio
+import time
 from pathlib import Path
 import shutil
 from loguru import logger
 
-from config.settings import settings
+from config.settings import get_settings
 from src.ingestion.langchain_processor import LangChainDocumentProcessor
-from src.ingestion.langchain_vector_store import LangChainVectorStore
+from src.ingestion.langchain_vector_store import LangChainVectorStore, get_vector_store
 from src.retrieval.retriever import Retriever
-from src.generation.openai_generator import OpenAIGenerator
+from src.generation.openai_generator import ANALYSIS_MAX_INPUT_TOKENS, OpenAIGenerator
 from src.rag_pipeline import RAGPipeline
 
 
+settings = get_settings()
+
+
+# Components holding network clients are built at startup, so each server
+# lifespan gets fresh connection pools (the shared vector store is rebuilt
+# after aclose() at shutdown)
+vector_store: LangChainVectorStore
+retriever: Retriever
+generator: OpenAIGenerator
+rag_pipeline: RAGPipeline
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Build the LangChain components at startup and close their pools at shutdown."""
+    global vector_store, retriever, generator, rag_pipeline
+    vector_store = get_vector_store()
+    retriever = Retriever(vector_store)
+    generator = OpenAIGenerator()
+    rag_pipeline = RAGPipeline(retriever, generator)
+    
+    yield
+    
+    await vector_store.aclose()
+
+
 # Initialize FastAPI app
 app = FastAPI(
     title="AI Research Knowledge Hub",
     description="RAG-enabled AI pipeline with OpenAI GPT, LangChain, and Qdrant",
-    version="2.0.0"
+    version="2.0.0",
+    lifespan=lifespan
 )
 
 # Add CORS middleware
@@ -36,14 +65,11 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Initialize LangChain components
-vector_store = LangChainVectorStore()
-retriever = Retriever(vector_store)
-generator = OpenAIGenerator()
-rag_pipeline = RAGPipeline(retriever, generator)
+# Document processing holds no network clients, so it is built at import
 document_processor = LangChainDocumentProcessor(
     chunk_size=settings.chunk_size,
-    chunk_overlap=settings.chunk_overlap
+    chunk_overlap=settings.chunk_overlap,
+    hash_algorithm=settings.doc_hash_algorithm
 )
 
 
@@ -87,6 +113,29 @@ class StatsResponse(BaseModel):
     collection_name: str
 
 
+# Health probes arrive every few seconds; reuse the collection info briefly
+_HEALTH_TTL_SECONDS = 5.0
+_health_cache = {"t": 0.0, "info": None}
+
+# Characters of leading text sampled for analysis: enough to cover the
+# analysis token budget, which the generator's tokenizer then enforces
+_ANALYSIS_SAMPLE_CHARS = ANALYSIS_MAX_INPUT_TOKENS * 8
+
+# File types accepted by /upload
+_ALLOWED_EXT: frozenset[str] = frozenset({'.pdf', '.txt', '.md', '.docx'})
+
+def _sample(texts: List[str], limit: int = _ANALYSIS_SAMPLE_CHARS) -> str:
+    """Join leading chunk texts, stopping as soon as `limit` characters are covered."""
+    parts = []
+    length = 0
+    for text in texts:
+        parts.append(text)
+        length += len(text) + 1
+        if length >= limit:
+            break
+    return " ".join(parts)[:limit]
+
+
 # API Endpoints
 @app.get("/")
 async def root():
@@ -106,14 +155,22 @@ async def root():
 
 @app.get("/health")
 async def health_check():
-    """Health check endpoint."""
+    """Health check endpoint. Collection info is cached for a few seconds."""
     try:
-        # Get collection info from Qdrant client
-        collection_info = vector_store.client.get_collection(vector_store.collection_name)
+        client, collection_name = vector_store.client, vector_store.collection_name
+        now = time.monotonic()
+        
+        if _health_cache["info"] is not None and now - _health_cache["t"] < _HEALTH_TTL_SECONDS:
+            collection_info = _health_cache["info"]
+        else:
+            # Get collection info from Qdrant client
+            collection_info = client.get_collection(collection_name)
+            _health_cache["t"], _health_cache["info"] = now, collection_info
+        
         return {
             "status": "healthy",
             "vector_store": "connected",
-            "collection": vector_store.collection_name,
+            "collection": collection_name,
             "documents": collection_info.points_count if collection_info else 0
         }
     except Exception as e:
@@ -140,7 +197,7 @@ async def query(request: QueryRequest):
         if top_k is not None and top_k <= 0:
             raise HTTPException(status_code=400, detail="top_k must be greater than 0")
         
-        result = rag_pipeline.query(
+        result = await rag_pipeline.aquery(
             question=request.question,
             top_k=top_k,
             system_prompt=request.system_prompt
@@ -168,13 +225,12 @@ async def query_stream(request: QueryRequest):
         logger.info(f"Received streaming query: {request.question}")
         
         async def generate():
-            for chunk in rag_pipeline.query_streaming(
+            async for chunk in rag_pipeline.query_streaming_async(
                 question=request.question,
                 top_k=request.top_k,
                 system_prompt=request.system_prompt
             ):
                 yield chunk
-                await asyncio.sleep(0.01)  # Small delay for streaming
         
         return StreamingResponse(generate(), media_type="text/plain")
     
@@ -192,7 +248,7 @@ async def upload_document(
     Upload and process a document with instant analysis.
     Extracts summaries, key terms, and generates Q&A.
     Vector embeddings are generated in the background.
-    Files are processed in memory without saving to disk.
+    Files are read from the upload buffer rather than loaded into memory at once.
     
     Args:
         file: Document file (PDF, TXT, MD, DOCX)
@@ -202,48 +258,56 @@ async def upload_document(
     """
     try:
         # Validate file type
-        allowed_extensions = ['.pdf', '.txt', '.md', '.docx']
         file_extension = Path(file.filename).suffix.lower()
         
-        if file_extension not in allowed_extensions:
+        if file_extension not in _ALLOWED_EXT:
             raise HTTPException(
                 status_code=400,
-                detail=f"Unsupported file type. Allowed: {allowed_extensions}"
+                detail=f"Unsupported file type. Allowed: {sorted(_ALLOWED_EXT)}"
             )
         
         logger.info(f"Processing uploaded file: {file.filename}")
         
-        # Read file content into memory
-        file_content = await file.read()
-        
-        # Process document from bytes (no disk I/O)
-        chunks = document_processor.process_upload(file.filename, file_content)
-        
-        # Check if document already exists
-        doc_id = chunks[0]["metadata"]["doc_id"] if chunks else None
-        is_duplicate = False
+        # Process the spooled upload directly instead of reading it into one
+        # bytes object; parsing is CPU-bound, so run it in a worker thread
+        batch = await asyncio.to_thread(
+            document_processor.process_upload, file.filename, file.file
+        )
         
-        if doc_id and vector_store.check_document_exists(doc_id):
-            is_duplicate = True
-            logger.info(f"Duplicate document detected: {file.filename} (doc_id: {doc_id})")
+        # Check if document already exists (a recent local record, else a Qdrant
+        # lookup in a worker thread); ingestion re-checks against Qdrant
+        doc_id = batch.doc_id if batch else None
+        exists_check = (
+            asyncio.to_thread(vector_store.check_document_exists, doc_id, use_local=True)
+            if doc_id else asyncio.sleep(0, result=False)
+        )
         
-        # Extract sample text for quick analysis (first 5000 chars for speed)
-        sample_text = " ".join([chunk["text"] for chunk in chunks[:5]])[:5000]
+        # Extract the leading text for analysis; analyze_document cuts it to
+        # ANALYSIS_MAX_INPUT_TOKENS tokens
+        sample_text = _sample(batch.texts)
         
         # Analyze document for summary, key terms, and Q&A (fast, uses sample)
+        # while the duplicate check runs concurrently. Re-uploads hit the
+        # generator's persistent analysis cache, which only stores successes.
         logger.info(f"Analyzing document: {file.filename}")
-        analysis = generator.analyze_document(sample_text, max_text_length=5000)
+        is_duplicate, analysis = await asyncio.gather(
+            exists_check,
+            asyncio.to_thread(generator.analyze_document, sample_text)
+        )
+        
+        if is_duplicate:
+            logger.info(f"Duplicate document detected: {file.filename} (doc_id: {doc_id})")
         
         # Add to vector store in background only if not a duplicate
         if is_duplicate:
             logger.info(f"Document {file.filename} already exists, skipping vector insertion")
         else:
-            background_tasks.add_task(vector_store.add_documents, chunks)
-            logger.info(f"Queued {len(chunks)} chunks for background processing from {file.filename}")
+            background_tasks.add_task(vector_store.aadd_documents, batch)
+            logger.info(f"Queued {len(batch)} chunks for background processing from {file.filename}")
         
         return UploadResponse(
             filename=file.filename,
-            chunks_created=len(chunks),
+            chunks_created=len(batch),
             status="duplicate" if is_duplicate else "processing",
             summary=analysis["summary"],
             key_terms=analysis["key_terms"],
@@ -260,11 +324,13 @@ async def upload_document(
 async def get_stats():
     """Get statistics about the knowledge base."""
     try:
-        collection_info = vector_store.client.get_collection(vector_store.collection_name)
+        client, collection_name = vector_store.client, vector_store.collection_name
+        collection_info = client.get_collection(collection_name)
+        points_count = collection_info.points_count
         stats = {
-            "total_documents": collection_info.points_count,
-            "total_chunks": collection_info.points_count,
-            "collection_name": vector_store.collection_name
+            "total_documents": points_count,
+            "total_chunks": points_count,
+            "collection_name": collection_name
         }
         return StatsResponse(**stats)
     
@@ -285,7 +351,7 @@ async def delete_document(doc_id: str):
         Deletion status
     """
     try:
-        vector_store.delete_documents(doc_id)
+        await asyncio.to_thread(vector_store.delete_documents, doc_id)
         return {"status": "success", "doc_id": doc_id}
     
     except Exception as e:
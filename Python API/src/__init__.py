@@ -1,3 +1,3 @@
 """Source package for RAG pipeline modules."""
 
-__all__ = ["ingestion", "retrieval", "generation", "rag_pipeline"]
+__all__ = ["clients", "ingestion", "retrieval", "generation", "rag_pipeline"]
@@ -0,0 +1,11 @@
+"""Shared network clients."""
+
+from .openai import get_async_http_client, get_async_openai_client
+from .qdrant import get_async_qdrant_client, get_qdrant_client
+
+__all__ = [
+    "get_qdrant_client",
+    "get_async_qdrant_client",
+    "get_async_openai_client",
+    "get_async_http_client",
+]
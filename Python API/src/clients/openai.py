@@ -0,0 +1,30 @@
+"""
+Process-wide async OpenAI client on a shared HTTP/2 connection pool.
+"""
+
+from functools import lru_cache
+import httpx
+from openai import AsyncOpenAI
+
+from config.settings import get_settings
+
+
+@lru_cache(maxsize=1)
+def get_async_http_client() -> httpx.AsyncClient:
+    """Return the shared keep-alive HTTP/2 pool used for OpenAI calls."""
+    return httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=64, max_connections=128, keepalive_expiry=60)
+    )
+
+
+@lru_cache(maxsize=1)
+def get_async_openai_client() -> AsyncOpenAI:
+    """
+    Return the shared async OpenAI client, creating it on first use.
+    
+    Callers needing different timeouts or retries should derive a client
+    with ``with_options``, which keeps the same connection pool.
+    """
+    settings = get_settings()
+    return AsyncOpenAI(api_key=settings.openai_api_key, http_client=get_async_http_client())
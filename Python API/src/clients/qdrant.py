@@ -0,0 +1,43 @@
+"""
+Process-wide Qdrant client shared by the API and maintenance scripts.
+"""
+
+from functools import lru_cache
+from qdrant_client import AsyncQdrantClient, QdrantClient
+
+from config.settings import get_settings
+
+# Payload fields used to look up documents by ID (LangChain and legacy format)
+DOC_ID_FIELDS = ("doc_id", "metadata.doc_id")
+
+
+@lru_cache(maxsize=1)
+def get_qdrant_client() -> QdrantClient:
+    """Return the shared Qdrant client, creating it on first use."""
+    settings = get_settings()
+    # gRPC sends vectors as packed floats instead of JSON
+    return QdrantClient(
+        url=settings.qdrant_url,
+        api_key=settings.qdrant_api_key or None,
+        timeout=60,
+        prefer_grpc=True,
+        grpc_port=settings.qdrant_grpc_port
+    )
+
+
+@lru_cache(maxsize=1)
+def get_async_qdrant_client() -> AsyncQdrantClient:
+    """
+    Return the shared async Qdrant client, creating it on first use.
+    
+    Channels are opened lazily and bound to the event loop that first uses
+    the client, so only call it from the application's loop.
+    """
+    settings = get_settings()
+    return AsyncQdrantClient(
+        url=settings.qdrant_url,
+        api_key=settings.qdrant_api_key or None,
+        timeout=60,
+        prefer_grpc=True,
+        grpc_port=settings.qdrant_grpc_port
+    )
@@ -0,0 +1,74 @@
+"""
+Persistent cache for document analysis results.
+
+Entries are stored in a small SQLite table so that repeat uploads of the
+same content skip the LLM call, even across restarts.
+"""
+
+import hashlib
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import orjson
+from loguru import logger
+
+
+class AnalysisCache:
+    """SQLite-backed key/value cache for analysis results with expiry."""
+
+    def __init__(self, path: str, ttl_seconds: int = 7 * 86400):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            path: SQLite database file path
+            ttl_seconds: How long entries stay valid
+        """
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS llm_analysis_cache ("
+            "key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL NOT NULL)"
+        )
+        # Reads skip expired rows; drop them here so the file doesn't grow forever
+        self._conn.execute("DELETE FROM llm_analysis_cache WHERE expires_at < ?", (time.time(),))
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(text: str, model: str, prompt_version: str) -> str:
+        """Build a cache key from the analyzed text, model and prompt version."""
+        digest = hashlib.md5(text.encode("utf-8")).hexdigest()
+        return f"{digest}:{model}:{prompt_version}"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached value for a key, or None if missing or expired."""
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT value, expires_at FROM llm_analysis_cache WHERE key = ?", (key,)
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Analysis cache read failed: {e}")
+            return None
+
+        if row is None or row[1] < time.time():
+            return None
+        return orjson.loads(row[0])
+
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        """Store a value under a key, replacing any previous entry."""
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO llm_analysis_cache (key, value, expires_at) VALUES (?, ?, ?)",
+                    (key, orjson.dumps(value), time.time() + self.ttl_seconds)
+                )
+                self._conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Analysis cache write failed: {e}")
@@ -1,33 +1,351 @@
 """
-Generation module using OpenAI GPT models via LangChain for RAG responses.
+Generation module using OpenAI GPT models for RAG responses.
+
+The default backend talks to the OpenAI SDK directly. Setting
+GENERATOR_BACKEND=langchain routes calls through LangChain's ChatOpenAI
+instead; LangChain is only imported when that backend is selected.
 """
 
 import os
-from typing import Dict, Any, Optional
-from langchain_community.chat_models import ChatOpenAI
-from langchain.schema import HumanMessage, SystemMessage
+from functools import lru_cache
+import orjson
+import tiktoken
+from typing import TYPE_CHECKING, AsyncIterator, Dict, Any, Iterator, List, Optional, Tuple
 from loguru import logger
-from config.settings import settings
+from openai import OpenAI
+from config.settings import get_settings
+from src.clients.openai import get_async_openai_client
+from src.generation.analysis_cache import AnalysisCache
+
+# Bump when the analysis prompt changes so cached results are not reused
+PROMPT_VERSION = "v2"
+
+# Document text sent for analysis is capped at this many tokens
+ANALYSIS_MAX_INPUT_TOKENS = 3000
+
+# Static system prompt for document analysis. It is kept identical across
+# calls and long enough (>1024 tokens, hence the worked examples) for
+# OpenAI's automatic prompt caching to reuse the prefix; only the user
+# message varies per document.
+_ANALYSIS_SYSTEM_PROMPT = """You are an expert research analyst. Quickly analyze the document and extract:
+1. A concise summary (2 sentences max)
+2. Top 5 key terms with brief definitions
+3. Generate 3 important Q&A pairs
+
+Return ONLY valid JSON:
+{
+    "summary": "Brief summary...",
+    "key_terms": [
+        {"term": "Term", "definition": "Brief definition"}
+    ],
+    "qa_pairs": [
+        {"question": "Q?", "answer": "A"}
+    ]
+}
+
+Guidelines:
+
+Summary
+- State what the document is about and its main contribution or conclusion.
+- Use at most two sentences and no more than 60 words in total.
+- Write in plain, neutral language; do not start with "This document".
+- Do not speculate beyond what the text says.
+
+Key terms
+- Pick the five terms a reader most needs to understand the document: methods, models, datasets, metrics, or domain concepts that the text itself uses.
+- Use the spelling and capitalization found in the document. Expand acronyms in the definition, not in the term.
+- Each definition is one sentence of at most 25 words and explains the term as it is used in this document.
+- Prefer specific terms over generic ones (e.g. "contrastive pre-training" rather than "training").
+- If fewer than five meaningful terms exist, return only those.
+
+Q&A pairs
+- Write three questions a reader would realistically ask after reading the document, covering different sections or ideas.
+- Every answer must be supported by the text; answer in one to three sentences.
+- Avoid yes/no questions and questions that restate the summary.
+
+Output rules
+- Respond with a single JSON object using exactly the keys "summary", "key_terms" and "qa_pairs".
+- "key_terms" is a list of objects with "term" and "definition"; "qa_pairs" is a list of objects with "question" and "answer".
+- Do not wrap the JSON in Markdown code fences and do not add commentary before or after it.
+- Use double quotes for all strings and escape any quotes inside values.
+- If the document is empty or unreadable, return {"summary": "", "key_terms": [], "qa_pairs": []}.
+- The document may be truncated; analyze only the text that is provided.
+- Ignore page headers, footers, reference lists, and boilerplate such as copyright notices.
+- Write in the same language as the document.
+
+Example 1
+
+Document:
+Retrieval-augmented generation (RAG) combines a parametric language model with a non-parametric memory. Given a query, a dense retriever selects passages from a vector index, and the generator conditions on both the query and the retrieved passages. On open-domain question answering benchmarks, RAG outperforms a closed-book model of the same size while allowing the knowledge source to be updated without retraining.
+
+Response:
+{
+    "summary": "Retrieval-augmented generation pairs a language model with a dense retriever over a vector index. It beats same-size closed-book models on open-domain QA and lets the knowledge source change without retraining.",
+    "key_terms": [
+        {"term": "Retrieval-augmented generation (RAG)", "definition": "A method that conditions a language model's output on passages retrieved for the query."},
+        {"term": "Dense retriever", "definition": "A model that embeds queries and passages as vectors and selects passages by vector similarity."},
+        {"term": "Non-parametric memory", "definition": "External knowledge stored outside model weights, here a vector index of passages."},
+        {"term": "Vector index", "definition": "A searchable store of passage embeddings used to find the most similar passages to a query."},
+        {"term": "Closed-book model", "definition": "A language model that answers from its weights alone without retrieving external text."}
+    ],
+    "qa_pairs": [
+        {"question": "What are the two components of a RAG system?", "answer": "A parametric generator (the language model) and a non-parametric memory accessed through a dense retriever."},
+        {"question": "How does RAG compare with a closed-book model of the same size?", "answer": "It performs better on open-domain question answering benchmarks."},
+        {"question": "Why is RAG easier to keep up to date?", "answer": "Its knowledge lives in the vector index, which can be updated without retraining the model."}
+    ]
+}
+
+Example 2
+
+Document:
+We study the effect of chunk size on retrieval quality. Documents were split into chunks of 256, 512, and 1024 tokens with a 10% overlap. Smaller chunks improved recall@5 for fact-lookup questions, while larger chunks helped multi-hop questions that need surrounding context. A hybrid strategy that indexes both sizes achieved the best overall accuracy at the cost of doubling index size.
+
+Response:
+{
+    "summary": "The study measures how chunk size affects retrieval, finding small chunks help fact lookup and large chunks help multi-hop questions. Indexing both sizes gives the best accuracy but doubles index size.",
+    "key_terms": [
+        {"term": "Chunk size", "definition": "The number of tokens in each piece a document is split into before indexing."},
+        {"term": "Overlap", "definition": "The share of tokens repeated between consecutive chunks, here 10%."},
+        {"term": "Recall@5", "definition": "The fraction of questions whose relevant chunk appears among the top five retrieved results."},
+        {"term": "Multi-hop question", "definition": "A question whose answer requires combining information from several parts of the text."},
+        {"term": "Hybrid strategy", "definition": "Indexing the same documents at multiple chunk sizes and retrieving from all of them."}
+    ],
+    "qa_pairs": [
+        {"question": "Which chunk sizes were compared?", "answer": "Chunks of 256, 512, and 1024 tokens, each with 10% overlap."},
+        {"question": "When do larger chunks help retrieval?", "answer": "For multi-hop questions that need surrounding context to be answered."},
+        {"question": "What is the trade-off of the hybrid strategy?", "answer": "It gives the best overall accuracy but doubles the size of the index."}
+    ]
+}"""
+
+if TYPE_CHECKING:
+    from langchain_community.chat_models import ChatOpenAI
+
+
+@lru_cache(maxsize=None)
+def _get_encoding(model: str) -> Optional[tiktoken.Encoding]:
+    """
+    Return the tokenizer for a model, loading it once per process.
+    
+    Returns None if the tokenizer can't be loaded. The failure is cached too,
+    so the BPE download (which has no timeout) is only attempted once.
+    """
+    try:
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            # Unknown to this tiktoken version; current OpenAI chat models use o200k
+            return tiktoken.get_encoding("o200k_base")
+    except Exception as e:
+        logger.warning(f"Tokenizer unavailable, truncating by characters: {e}")
+        return None
+
+
+def _truncate_tokens(text: str, model: str, max_tokens: int) -> str:
+    """Cut text to at most max_tokens tokens of the model's tokenizer."""
+    encoding = _get_encoding(model)
+    if encoding is None:
+        # The BPE file is downloaded on first use; fall back to ~4 chars/token
+        return text[:max_tokens * 4]
+    
+    tokens = encoding.encode(text, disallowed_special=())
+    return text if len(tokens) <= max_tokens else encoding.decode(tokens[:max_tokens])
 
 
 class OpenAIGenerator:
-    """Generates responses using OpenAI GPT models with RAG context via LangChain."""
+    """Generates responses using OpenAI GPT models with RAG context."""
     
     def __init__(self):
-        """Initialize OpenAI API client via LangChain."""
-        logger.info("Initializing OpenAI generator with LangChain")
-        os.environ["OPENAI_API_KEY"] = settings.openai_api_key
-
-        # Create LangChain ChatOpenAI client
-        self.client = ChatOpenAI(
-            model="gpt-4o-mini",
-            temperature=0.5,
-            max_tokens=1000,
-            request_timeout=20.0
-        )
+        """Initialize the OpenAI client for the configured backend."""
+        settings = get_settings()
+        self.backend = settings.generator_backend
         self.model = "gpt-4o-mini"
+        logger.info(f"Initializing OpenAI generator ({self.backend} backend)")
+        
+        if self.backend == "langchain":
+            from langchain_community.chat_models import ChatOpenAI
+            
+            os.environ["OPENAI_API_KEY"] = settings.openai_api_key
+            self.client: "ChatOpenAI | OpenAI" = ChatOpenAI(
+                model=self.model,
+                temperature=0.5,
+                max_tokens=1000,
+                request_timeout=20.0
+            )
+            # Separate JSON-mode client for document analysis, reused across calls
+            self._json_client = ChatOpenAI(
+                model=self.model,
+                temperature=0.2,
+                max_tokens=800,
+                model_kwargs={"response_format": {"type": "json_object"}}
+            )
+        else:
+            self.client = OpenAI(api_key=settings.openai_api_key, timeout=20.0)
+            # Shares the process-wide HTTP/2 connection pool
+            self.async_client = get_async_openai_client().with_options(timeout=20.0)
+        
+        # Prompts don't change between calls; build them once
+        self._default_system_prompt = self._get_default_system_prompt()
+        self._user_template = self._get_user_template()
+        
+        # Persistent cache of analysis results keyed by analyzed content
+        self.analysis_cache = AnalysisCache(settings.analysis_cache_path)
+        
         logger.info(f"Using model: {self.model}")
     
+    def _complete(
+        self,
+        messages: List[Dict[str, str]],
+        max_tokens: int,
+        temperature: float,
+        json_mode: bool = False
+    ) -> Dict[str, Any]:
+        """Run a chat completion on the active backend and normalize the result."""
+        if self.backend == "langchain":
+            client = self._json_client if json_mode else self.client
+            response = client.invoke(
+                self._to_langchain_messages(messages),
+                max_tokens=max_tokens,
+                temperature=temperature
+            )
+            return self._langchain_result(response)
+        
+        kwargs = {"response_format": {"type": "json_object"}} if json_mode else {}
+        response = self.client.chat.completions.create(
+            model=self.model,
+            messages=messages,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            **kwargs
+        )
+        return self._openai_result(response)
+    
+    async def _acomplete(
+        self,
+        messages: List[Dict[str, str]],
+        max_tokens: int,
+        temperature: float,
+        json_mode: bool = False
+    ) -> Dict[str, Any]:
+        """Async counterpart of _complete."""
+        if self.backend == "langchain":
+            client = self._json_client if json_mode else self.client
+            response = await client.ainvoke(
+                self._to_langchain_messages(messages),
+                max_tokens=max_tokens,
+                temperature=temperature
+            )
+            return self._langchain_result(response)
+        
+        kwargs = {"response_format": {"type": "json_object"}} if json_mode else {}
+        response = await self.async_client.chat.completions.create(
+            model=self.model,
+            messages=messages,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            **kwargs
+        )
+        return self._openai_result(response)
+    
+    @staticmethod
+    def _langchain_result(response: Any) -> Dict[str, Any]:
+        """Normalize a LangChain chat response."""
+        return {
+            "content": response.content,
+            "usage": {
+                "prompt_tokens": 0,  # LangChain doesn't expose this directly
+                "completion_tokens": 0,
+                "total_tokens": 0
+            }
+        }
+    
+    @classmethod
+    def _openai_result(cls, response: Any) -> Dict[str, Any]:
+        """Normalize an OpenAI SDK chat completion."""
+        usage = response.usage
+        return {
+            "content": response.choices[0].message.content,
+            "usage": {
+                "prompt_tokens": usage.prompt_tokens if usage else 0,
+                "completion_tokens": usage.completion_tokens if usage else 0,
+                "total_tokens": usage.total_tokens if usage else 0,
+                "cached_tokens": cls._cached_prompt_tokens(usage)
+            }
+        }
+    
+    @staticmethod
+    def _cached_prompt_tokens(usage: Any) -> int:
+        """Return the number of prompt tokens served from OpenAI's prompt cache."""
+        details = getattr(usage, "prompt_tokens_details", None)
+        if details is None:
+            return 0
+        if isinstance(details, dict):
+            return details.get("cached_tokens") or 0
+        return getattr(details, "cached_tokens", 0) or 0
+    
+    def _stream(
+        self,
+        messages: List[Dict[str, str]],
+        max_tokens: int,
+        temperature: float
+    ) -> Iterator[str]:
+        """Stream text deltas from the active backend."""
+        if self.backend == "langchain":
+            for chunk in self.client.stream(
+                self._to_langchain_messages(messages),
+                max_tokens=max_tokens,
+                temperature=temperature
+            ):
+                if chunk.content:
+                    yield chunk.content
+            return
+        
+        stream = self.client.chat.completions.create(
+            model=self.model,
+            messages=messages,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            stream=True
+        )
+        for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+    
+    async def _astream(
+        self,
+        messages: List[Dict[str, str]],
+        max_tokens: int,
+        temperature: float
+    ) -> AsyncIterator[str]:
+        """Stream text deltas from the active backend without blocking the event loop."""
+        if self.backend == "langchain":
+            async for chunk in self.client.astream(
+                self._to_langchain_messages(messages),
+                max_tokens=max_tokens,
+                temperature=temperature
+            ):
+                if chunk.content:
+                    yield chunk.content
+            return
+        
+        stream = await self.async_client.chat.completions.create(
+            model=self.model,
+            messages=messages,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            stream=True
+        )
+        async for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+    
+    @staticmethod
+    def _to_langchain_messages(messages: List[Dict[str, str]]) -> list:
+        """Convert role/content dicts to LangChain message objects."""
+        from langchain.schema import HumanMessage, SystemMessage
+        
+        message_types = {"system": SystemMessage, "user": HumanMessage}
+        return [message_types[m["role"]](content=m["content"]) for m in messages]
+    
     def generate(
         self,
         query: str,
@@ -49,6 +367,74 @@ class OpenAIGenerator:
         Returns:
             Dict with generated text and metadata
         """
+        messages, max_tokens, temperature = self._prepare_generation(
+            query, context, system_prompt, max_tokens, temperature
+        )
+        
+        try:
+            response = self._complete(messages, max_tokens=max_tokens, temperature=temperature)
+            
+            logger.info("Response generated successfully")
+            
+            return {
+                "answer": response["content"],
+                "model": self.model,
+                "usage": response["usage"]
+            }
+        
+        except Exception as e:
+            logger.error(f"Error generating response: {str(e)}")
+            raise
+    
+    async def agenerate(
+        self,
+        query: str,
+        context: str,
+        system_prompt: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+        temperature: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Generate a response using the async client, without blocking the event loop.
+        
+        Args:
+            query: User question
+            context: Retrieved context from vector store
+            system_prompt: Optional system prompt override
+            max_tokens: Optional max tokens override
+            temperature: Optional temperature override
+            
+        Returns:
+            Dict with generated text and metadata
+        """
+        messages, max_tokens, temperature = self._prepare_generation(
+            query, context, system_prompt, max_tokens, temperature
+        )
+        
+        try:
+            response = await self._acomplete(messages, max_tokens=max_tokens, temperature=temperature)
+            
+            logger.info("Response generated successfully")
+            
+            return {
+                "answer": response["content"],
+                "model": self.model,
+                "usage": response["usage"]
+            }
+        
+        except Exception as e:
+            logger.error(f"Error generating response: {str(e)}")
+            raise
+    
+    def _prepare_generation(
+        self,
+        query: str,
+        context: str,
+        system_prompt: Optional[str],
+        max_tokens: Optional[int],
+        temperature: Optional[float]
+    ) -> Tuple[List[Dict[str, str]], int, float]:
+        """Resolve generation defaults and build the chat messages."""
         # Use faster defaults for query API
         if max_tokens is None:
             max_tokens = 1000  # Reduced from 4096 for faster responses
@@ -58,7 +444,7 @@ class OpenAIGenerator:
         
         # Default system prompt for RAG
         if system_prompt is None:
-            system_prompt = self._get_default_system_prompt()
+            system_prompt = self._default_system_prompt
         
         # Check if no relevant context found
         if "No relevant documents found" in context:
@@ -71,31 +457,11 @@ class OpenAIGenerator:
         
         logger.info(f"Generating response for query: '{query[:100]}...'")
         
-        try:
-            # Use LangChain ChatOpenAI
-            messages = [
-                SystemMessage(content=system_prompt),
-                HumanMessage(content=user_message)
-            ]
-            
-            response = self.client.invoke(messages)
-            response_text = response.content
-            
-            logger.info("Response generated successfully")
-            
-            return {
-                "answer": response_text,
-                "model": self.model,
-                "usage": {
-                    "prompt_tokens": 0,  # LangChain doesn't expose this directly
-                    "completion_tokens": 0,
-                    "total_tokens": 0
-                }
-            }
-        
-        except Exception as e:
-            logger.error(f"Error generating response: {str(e)}")
-            raise
+        messages = [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_message}
+        ]
+        return messages, max_tokens, temperature
     
     def _get_default_system_prompt(self) -> str:
         """Get default system prompt for RAG."""
@@ -110,9 +476,9 @@ Your role is to:
 
 If the context doesn't contain relevant information to answer the question, say so clearly and provide what general knowledge you can while noting it's not from the knowledge base."""
     
-    def _construct_user_message(self, query: str, context: str) -> str:
-        """Construct the user message with query and context."""
-        return f"""Based on the following context from the knowledge base, please answer the question.
+    def _get_user_template(self) -> str:
+        """Get the user message template with {context} and {query} placeholders."""
+        return """Based on the following context from the knowledge base, please answer the question.
 
 Context:
 {context}
@@ -121,6 +487,10 @@ Question: {query}
 
 Please provide a comprehensive answer based on the context above. If the context doesn't contain enough information, acknowledge this limitation."""
     
+    def _construct_user_message(self, query: str, context: str) -> str:
+        """Construct the user message with query and context."""
+        return self._user_template.format(context=context, query=query)
+    
     def generate_streaming(
         self,
         query: str,
@@ -142,6 +512,61 @@ Please provide a comprehensive answer based on the context above. If the context
         Yields:
             Text chunks from the streaming response
         """
+        messages, max_tokens, temperature = self._prepare_streaming(
+            query, context, system_prompt, max_tokens, temperature
+        )
+        
+        try:
+            yield from self._stream(messages, max_tokens=max_tokens, temperature=temperature)
+        
+        except Exception as e:
+            logger.error(f"Error in streaming response: {str(e)}")
+            raise
+    
+    async def generate_streaming_async(
+        self,
+        query: str,
+        context: str,
+        system_prompt: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+        temperature: Optional[float] = None
+    ) -> AsyncIterator[str]:
+        """
+        Generate a streaming response using the async OpenAI client.
+        
+        Args:
+            query: User question
+            context: Retrieved context from vector store
+            system_prompt: Optional system prompt override
+            max_tokens: Optional max tokens override
+            temperature: Optional temperature override
+            
+        Yields:
+            Text chunks from the streaming response
+        """
+        messages, max_tokens, temperature = self._prepare_streaming(
+            query, context, system_prompt, max_tokens, temperature
+        )
+        
+        try:
+            async for chunk in self._astream(messages, max_tokens=max_tokens, temperature=temperature):
+                yield chunk
+        
+        except Exception as e:
+            logger.error(f"Error in streaming response: {str(e)}")
+            raise
+    
+    def _prepare_streaming(
+        self,
+        query: str,
+        context: str,
+        system_prompt: Optional[str],
+        max_tokens: Optional[int],
+        temperature: Optional[float]
+    ) -> Tuple[List[Dict[str, str]], int, float]:
+        """Resolve streaming defaults and build the chat messages."""
+        settings = get_settings()
+        
         if max_tokens is None:
             max_tokens = settings.openai_max_tokens
         
@@ -149,86 +574,65 @@ Please provide a comprehensive answer based on the context above. If the context
             temperature = settings.openai_temperature
         
         if system_prompt is None:
-            system_prompt = self._get_default_system_prompt()
+            system_prompt = self._default_system_prompt
         
         user_message = self._construct_user_message(query, context)
         
         logger.info(f"Generating streaming response for query: '{query[:100]}...'")
         
-        try:
-            messages = [
-                SystemMessage(content=system_prompt),
-                HumanMessage(content=user_message)
-            ]
-            
-            for chunk in self.client.stream(messages):
-                if chunk.content:
-                    yield chunk.content
-        
-        except Exception as e:
-            logger.error(f"Error in streaming response: {str(e)}")
-            raise
+        messages = [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_message}
+        ]
+        return messages, max_tokens, temperature
     
-    def analyze_document(self, text: str, max_text_length: int = 15000) -> Dict[str, Any]:
+    def analyze_document(self, text: str) -> Dict[str, Any]:
         """
         Analyze a document to extract summary, key terms, and generate Q&A.
         
         Args:
-            text: Document text to analyze
-            max_text_length: Maximum text length to send to API (to avoid token limits)
+            text: Document text to analyze; only the first
+                ANALYSIS_MAX_INPUT_TOKENS tokens are sent to the API
             
         Returns:
             Dict with summary, key_terms, and qa_pairs
         """
-        # Truncate text if too long (use even less for faster response)
-        truncated_text = text[:5000] if len(text) > 5000 else text
+        # Truncate by tokens so input size is predictable however dense the text is
+        truncated_text = _truncate_tokens(text, self.model, ANALYSIS_MAX_INPUT_TOKENS)
         
-        system_prompt = """You are an expert research analyst. Quickly analyze the document and extract:
-1. A concise summary (2 sentences max)
-2. Top 5 key terms with brief definitions
-3. Generate 3 important Q&A pairs
-
-Return ONLY valid JSON:
-{
-    "summary": "Brief summary...",
-    "key_terms": [
-        {"term": "Term", "definition": "Brief definition"}
-    ],
-    "qa_pairs": [
-        {"question": "Q?", "answer": "A"}
-    ]
-}"""
+        cache_key = AnalysisCache.make_key(truncated_text, self.model, PROMPT_VERSION)
+        cached = self.analysis_cache.get(cache_key)
+        if cached is not None:
+            logger.info("Using cached document analysis")
+            return cached
         
         user_message = f"Analyze:\n\n{truncated_text}"
         
         logger.info("Analyzing document for summary, key terms, and Q&A")
         
         try:
-            # Create a temporary client for JSON mode
-            json_client = ChatOpenAI(
-                model="gpt-4o-mini",
-                temperature=0.2,
-                max_tokens=800,
-                model_kwargs={"response_format": {"type": "json_object"}}
-            )
-            
             messages = [
-                SystemMessage(content=system_prompt),
-                HumanMessage(content=user_message)
+                {"role": "system", "content": _ANALYSIS_SYSTEM_PROMPT},
+                {"role": "user", "content": user_message}
             ]
             
-            response = json_client.invoke(messages)
+            # JSON mode with a low temperature for consistent structure
+            response = self._complete(messages, max_tokens=800, temperature=0.2, json_mode=True)
             
-            import json
-            analysis = json.loads(response.content)
+            analysis = orjson.loads(response["content"])
             
-            logger.info("Document analysis completed successfully")
+            logger.info(
+                "Document analysis completed successfully "
+                f"(cached prompt tokens: {response['usage'].get('cached_tokens', 0)})"
+            )
             
-            return {
+            result = {
                 "summary": analysis.get("summary", ""),
                 "key_terms": analysis.get("key_terms", [])[:5],  # Max 5 terms
                 "qa_pairs": analysis.get("qa_pairs", [])[:3]  # Max 3 Q&A
             }
+            self.analysis_cache.set(cache_key, result)
+            return result
         
         except Exception as e:
             logger.error(f"Error analyzing document: {str(e)}")
@@ -1,6 +1,6 @@
 """Document ingestion module with LangChain."""
 
-from .langchain_processor import LangChainDocumentProcessor
-from .langchain_vector_store import LangChainVectorStore
+from .langchain_processor import ChunkBatch, LangChainDocumentProcessor
+from .langchain_vector_store import LangChainVectorStore, get_vector_store
 
-__all__ = ["LangChainDocumentProcessor", "LangChainVectorStore"]
+__all__ = ["ChunkBatch", "LangChainDocumentProcessor", "LangChainVectorStore", "get_vector_store"]
@@ -0,0 +1,119 @@
+"""
+Micro-batching of concurrent single-text embedding requests.
+
+Concurrent queries each need one embedding; collecting the texts that
+arrive within a few milliseconds into one API call saves a round trip per
+request under load.
+"""
+
+import asyncio
+from typing import Awaitable, Callable, List, Optional, Sequence, Set, Tuple
+
+from loguru import logger
+
+EmbedBatch = Callable[[List[str]], Awaitable[Sequence[Sequence[float]]]]
+
+
+class AsyncEmbeddingBatcher:
+    """Coalesces concurrent embedding requests into batched calls."""
+
+    def __init__(self, embed_batch: EmbedBatch, max_batch_size: int = 32, max_wait_ms: float = 10):
+        """
+        Create a batcher; its worker starts on the first submit.
+
+        Args:
+            embed_batch: Coroutine function embedding a list of texts in order
+            max_batch_size: Flush as soon as this many texts are waiting
+            max_wait_ms: Flush at most this long after the first text arrived
+        """
+        self._embed_batch = embed_batch
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self._queue: Optional["asyncio.Queue[Tuple[str, asyncio.Future]]"] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._flushes: Set[asyncio.Task] = set()
+
+    async def submit(self, text: str) -> List[float]:
+        """Queue a text for embedding and wait for its vector."""
+        # Created lazily so the queue and worker belong to the running loop
+        if self._worker is None or self._worker.done():
+            # Nothing will serve texts left in a stopped worker's queue
+            self._fail_pending(RuntimeError("Embedding batcher worker stopped"))
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._run())
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((text, future))
+        return await future
+
+    async def aclose(self) -> None:
+        """Stop the worker; a later submit starts a new one."""
+        if self._worker is not None and not self._worker.done():
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+        self._worker = None
+        self._fail_pending(RuntimeError("Embedding batcher closed"))
+
+    def _fail_pending(self, error: Exception) -> None:
+        """Fail every future still waiting in the queue, then drop the queue."""
+        if self._queue is None:
+            return
+        while not self._queue.empty():
+            _, future = self._queue.get_nowait()
+            self._fail(future, error)
+        self._queue = None
+
+    @staticmethod
+    def _fail(future: asyncio.Future, error: Exception) -> None:
+        """Fail a waiting future; futures of a closed loop can't be resolved."""
+        if not future.done():
+            try:
+                future.set_exception(error)
+            except RuntimeError:
+                pass
+
+    async def _run(self) -> None:
+        """Collect queued texts into batches and flush each one."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+
+            try:
+                while len(batch) < self.max_batch_size:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+            except asyncio.CancelledError:
+                # Texts already taken off the queue would otherwise wait forever
+                for _, future in batch:
+                    self._fail(future, RuntimeError("Embedding batcher closed"))
+                raise
+
+            # Flush in the background so the next batch can start collecting
+            task = asyncio.create_task(self._flush(batch))
+            self._flushes.add(task)
+            task.add_done_callback(self._flushes.discard)
+
+    async def _flush(self, batch: List[Tuple[str, asyncio.Future]]) -> None:
+        """Embed one batch and resolve the waiting futures."""
+        try:
+            vectors = await self._embed_batch([text for text, _ in batch])
+        except Exception as e:
+            logger.error(f"Batched embedding of {len(batch)} texts failed: {e}")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        # Callers that gave up (e.g. disconnected clients) have cancelled futures
+        for (_, future), vector in zip(batch, vectors):
+            if not future.done():
+                future.set_result(vector)
@@ -0,0 +1,76 @@
+"""
+Persistent cache for query embeddings.
+
+Vectors are stored as float16 in a small SQLite table, so repeated queries
+skip the embeddings call even across restarts at half the float32 size.
+"""
+
+import hashlib
+import sqlite3
+import struct
+import threading
+import time
+from pathlib import Path
+from typing import List, Optional
+
+from loguru import logger
+
+
+class EmbeddingCache:
+    """SQLite-backed cache mapping (model, text hash) to a float16 vector."""
+
+    def __init__(self, path: str, ttl_seconds: int = 86400):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            path: SQLite database file path
+            ttl_seconds: How long entries stay valid
+        """
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embedding_cache ("
+            "key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL NOT NULL)"
+        )
+        # Reads skip expired rows; drop them here so the file doesn't grow forever
+        self._conn.execute("DELETE FROM embedding_cache WHERE expires_at < ?", (time.time(),))
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(text: str, model: str) -> str:
+        """Build a cache key from the embedded text and model."""
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        return f"{model}:{digest}"
+
+    def get(self, key: str) -> Optional[List[float]]:
+        """Return the cached vector for a key, or None if missing or expired."""
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT value, expires_at FROM embedding_cache WHERE key = ?", (key,)
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Embedding cache read failed: {e}")
+            return None
+
+        if row is None or row[1] < time.time():
+            return None
+        value = row[0]
+        return list(struct.unpack(f"<{len(value) // 2}e", value))
+
+    def set(self, key: str, vector: List[float]) -> None:
+        """Store a vector under a key, replacing any previous entry."""
+        try:
+            value = struct.pack(f"<{len(vector)}e", *vector)
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO embedding_cache (key, value, expires_at) VALUES (?, ?, ?)",
+                    (key, value, time.time() + self.ttl_seconds)
+                )
+                self._conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Embedding cache write failed: {e}")
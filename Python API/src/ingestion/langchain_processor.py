@@ -2,73 +2,112 @@
 LangChain-based document processor for handling various file formats.
 """
 
-from typing import List, Dict, Any
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import BinaryIO, List, Dict, Any
 import hashlib
-import io
 from pathlib import Path
+import threading
+from docx import Document as DocxDocument
 from loguru import logger
+from lxml import etree, html as lxml_html
+import markdown
+import pypdfium2 as pdfium
 
 from langchain_text_splitters import RecursiveCharacterTextSplitter
-from langchain_community.document_loaders import (
-    PyPDFLoader,
-    TextLoader,
-    UnstructuredMarkdownLoader,
-    Docx2txtLoader
-)
 from langchain.docstore.document import Document as LangChainDocument
 
 
+@dataclass(slots=True)
+class ChunkBatch:
+    """Chunks of a single document stored as parallel lists."""
+    
+    texts: List[str]
+    metadatas: List[Dict[str, Any]]
+    doc_id: str
+    
+    def __len__(self) -> int:
+        return len(self.texts)
+
+
+# pdfium must not be called from two threads at once, even for separate
+# documents, and uploads are parsed on worker threads
+_PDFIUM_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=8)
+def _get_splitter(chunk_size: int, chunk_overlap: int) -> RecursiveCharacterTextSplitter:
+    """Return a shared text splitter for the given chunking parameters."""
+    return RecursiveCharacterTextSplitter(
+        chunk_size=chunk_size,
+        chunk_overlap=chunk_overlap,
+        length_function=len,
+        separators=["\n\n", "\n", " ", ""]
+    )
+
+
 class LangChainDocumentProcessor:
     """Process documents using LangChain's loaders and text splitters."""
     
-    def __init__(self, chunk_size: int = 1000, chunk_overlap: int = 200):
+    def __init__(self, chunk_size: int = 1000, chunk_overlap: int = 200, hash_algorithm: str = "md5"):
         """
         Initialize LangChain document processor.
         
         Args:
             chunk_size: Size of text chunks
             chunk_overlap: Overlap between chunks
+            hash_algorithm: Content hash used for doc_id ("md5" or "blake3")
         """
         self.chunk_size = chunk_size
         self.chunk_overlap = chunk_overlap
         
-        # Initialize text splitter
-        self.text_splitter = RecursiveCharacterTextSplitter(
-            chunk_size=chunk_size,
-            chunk_overlap=chunk_overlap,
-            length_function=len,
-            separators=["\n\n", "\n", " ", ""]
-        )
+        # doc_ids are content hashes, so changing the algorithm means existing
+        # documents are no longer recognized as duplicates
+        if hash_algorithm == "blake3":
+            import blake3
+            self._digest = blake3.blake3
+        elif hash_algorithm == "md5":
+            self._digest = "md5"
+        else:
+            raise ValueError(f"Unsupported hash algorithm: {hash_algorithm}")
+        
+        # Splitters are stateless, so processors with the same settings share one
+        self.text_splitter = _get_splitter(chunk_size, chunk_overlap)
         
         logger.info(f"LangChain processor initialized (chunk_size={chunk_size}, overlap={chunk_overlap})")
     
-    def process_upload(self, filename: str, file_content: bytes) -> List[Dict[str, Any]]:
+    def process_upload(self, filename: str, file: BinaryIO) -> ChunkBatch:
         """
         Process uploaded file using LangChain loaders.
         
+        The file is read incrementally, so large uploads are never held in
+        memory as a single bytes object.
+        
         Args:
             filename: Original filename
-            file_content: File content as bytes
+            file: Seekable binary file object with the upload content
             
         Returns:
-            List of document chunks with metadata
+            ChunkBatch with chunk texts and metadata
         """
         file_extension = Path(filename).suffix.lower()
         
         # Generate doc_id from file content hash
-        doc_id = hashlib.md5(file_content).hexdigest()
+        file.seek(0)
+        doc_id = hashlib.file_digest(file, self._digest).hexdigest()
+        file.seek(0)
         
         logger.info(f"Processing {filename} with LangChain (doc_id: {doc_id})")
         
         # Load document based on file type
         if file_extension == '.pdf':
-            documents = self._load_pdf_from_bytes(filename, file_content)
+            documents = self._load_pdf_from_file(filename, file)
         elif file_extension == '.txt':
-            documents = self._load_text_from_bytes(filename, file_content)
+            documents = self._load_text_from_file(filename, file)
         elif file_extension == '.md':
-            documents = self._load_markdown_from_bytes(filename, file_content)
+            documents = self._load_markdown_from_file(filename, file)
         elif file_extension == '.docx':
-            documents = self._load_docx_from_bytes(filename, file_content)
+            documents = self._load_docx_from_file(filename, file)
         else:
             raise ValueError(f"Unsupported file format: {file_extension}")
         
@@ -77,69 +116,66 @@ class LangChainDocumentProcessor:
         
         logger.info(f"Split {filename} into {len(chunks)} chunks using LangChain")
         
-        # Convert to our format with metadata
-        result = []
-        for idx, chunk in enumerate(chunks):
-            result.append({
-                "text": chunk.page_content,
-                "metadata": {
-                    "source": filename,
-                    "filename": filename,
-                    "chunk_index": idx,
-                    "file_type": file_extension,
-                    "doc_id": doc_id,
-                    **chunk.metadata  # Include any metadata from loader
-                }
-            })
-        
-        return result
+        # Convert to parallel text/metadata lists
+        texts = [chunk.page_content for chunk in chunks]
+        metadatas = [
+            {
+                "source": filename,
+                "filename": filename,
+                "chunk_index": idx,
+                "file_type": file_extension,
+                "doc_id": doc_id,
+                **chunk.metadata  # Include any metadata from loader
+            }
+            for idx, chunk in enumerate(chunks)
+        ]
+        
+        return ChunkBatch(texts=texts, metadatas=metadatas, doc_id=doc_id)
     
-    def _load_pdf_from_bytes(self, filename: str, file_content: bytes) -> List[LangChainDocument]:
-        """Load PDF from bytes using LangChain."""
-        # Save temporarily to process with PyPDFLoader
-        temp_path = f"/tmp/{filename}"
-        with open(temp_path, "wb") as f:
-            f.write(file_content)
-        
-        loader = PyPDFLoader(temp_path)
-        documents = loader.load()
-        
-        # Clean up temp file
-        Path(temp_path).unlink(missing_ok=True)
-        
-        return documents
+    def _load_pdf_from_file(self, filename: str, file: BinaryIO) -> List[LangChainDocument]:
+        """Load PDF from a file object, one document per page."""
+        # pdfium (C) extracts text far faster than pure-Python pypdf. It is not
+        # thread-safe, so all pdfium calls for one upload run under a global lock.
+        with _PDFIUM_LOCK:
+            pdf = pdfium.PdfDocument(file)
+            try:
+                documents = []
+                for page_number in range(len(pdf)):
+                    page = pdf[page_number]
+                    textpage = page.get_textpage()
+                    documents.append(LangChainDocument(
+                        page_content=textpage.get_text_range(),
+                        metadata={"source": filename, "page": page_number}
+                    ))
+                    textpage.close()
+                    page.close()
+                return documents
+            finally:
+                pdf.close()
     
-    def _load_text_from_bytes(self, filename: str, file_content: bytes) -> List[LangChainDocument]:
-        """Load text file from bytes."""
-        text = file_content.decode('utf-8')
+    def _load_text_from_file(self, filename: str, file: BinaryIO) -> List[LangChainDocument]:
+        """Load text file from a file object."""
+        text = file.read().decode('utf-8')
         return [LangChainDocument(page_content=text, metadata={"source": filename})]
     
-    def _load_markdown_from_bytes(self, filename: str, file_content: bytes) -> List[LangChainDocument]:
-        """Load markdown from bytes."""
-        # Save temporarily
-        temp_path = f"/tmp/{filename}"
-        with open(temp_path, "wb") as f:
-            f.write(file_content)
-        
-        loader = UnstructuredMarkdownLoader(temp_path)
-        documents = loader.load()
-        
-        # Clean up
-        Path(temp_path).unlink(missing_ok=True)
-        
-        return documents
+    def _load_markdown_from_file(self, filename: str, file: BinaryIO) -> List[LangChainDocument]:
+        """Load markdown from a file object as plain text."""
+        html = markdown.markdown(file.read().decode('utf-8'))
+        
+        # libxml2 strips the rendered HTML back to text. fromstring rejects
+        # input with no elements (empty, or only comments), which has no text.
+        try:
+            text = lxml_html.fromstring(html).text_content()
+        except etree.ParserError:
+            text = ""
+        return [LangChainDocument(page_content=text, metadata={"source": filename})]
     
-    def _load_docx_from_bytes(self, filename: str, file_content: bytes) -> List[LangChainDocument]:
-        """Load DOCX from bytes."""
-        # Save temporarily
-        temp_path = f"/tmp/{filename}"
-        with open(temp_path, "wb") as f:
-            f.write(file_content)
-        
-        loader = Docx2txtLoader(temp_path)
-        documents = loader.load()
+    def _load_docx_from_file(self, filename: str, file: BinaryIO) -> List[LangChainDocument]:
+        """Load DOCX from a file object."""
+        doc = DocxDocument(file)
         
-        # Clean up
-        Path(temp_path).unlink(missing_ok=True)
+        # Paragraphs followed by table cell text, as docx2txt extracted both
+        parts = [paragraph.text for paragraph in doc.paragraphs]
+        parts.extend(cell.text for table in doc.tables for row in table.rows for cell in row.cells)
         
-        return documents
+        return [LangChainDocument(page_content="\n".join(parts), metadata={"source": filename})]
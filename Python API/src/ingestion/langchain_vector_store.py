@@ -2,56 +2,245 @@
 LangChain-based vector store using Qdrant and OpenAI embeddings.
 """
 
-from typing import List, Dict, Any
+from array import array
+import base64
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
+import asyncio
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Sequence, Set
 from loguru import logger
+import numpy as np
 import os
+import random
+import sqlite3
 import threading
+import time
+import uuid
+from weakref import WeakValueDictionary
 
 from langchain.embeddings.openai import OpenAIEmbeddings
-from langchain.vectorstores import Qdrant  # langchain-qdrant integration
-from qdrant_client import QdrantClient
-from qdrant_client.models import Distance, VectorParams, Filter, FieldCondition, MatchValue
+from openai import APIConnectionError, APITimeoutError, ConflictError, InternalServerError, RateLimitError
+from qdrant_client.models import (
+    Distance, VectorParams, Filter, FieldCondition, MatchValue, Batch, PayloadSchemaType,
+    IsEmptyCondition, PayloadField, OptimizersConfigDiff, MatchAny, FilterSelector,
+    ScalarQuantization, ScalarQuantizationConfig, ScalarType, SearchParams, QuantizationSearchParams
+)
 
-from config.settings import settings
+from config.settings import get_settings
+from src.clients.openai import get_async_http_client, get_async_openai_client
+from src.clients.qdrant import DOC_ID_FIELDS, get_async_qdrant_client, get_qdrant_client
+from src.ingestion.embedding_batcher import AsyncEmbeddingBatcher
+from src.ingestion.embedding_cache import EmbeddingCache
+from src.ingestion.langchain_processor import ChunkBatch
+
+# Chunks per embedding/upsert request, and how many requests run at once
+EMBED_BATCH_SIZE = 256
+EMBED_CONCURRENCY = 4
+
+# Qdrant's default, restored if the collection doesn't report its own threshold
+DEFAULT_INDEXING_THRESHOLD = 20000
+
+# Qdrant upsert requests in flight at once during async ingestion
+UPSERT_CONCURRENCY = 4
+
+# Attempts per embedding request when OpenAI rate-limits us (429) or the
+# request fails transiently (connection errors, timeouts, 409, 5xx)
+EMBED_MAX_ATTEMPTS = 5
+EMBED_RETRYABLE_ERRORS = (
+    RateLimitError, APIConnectionError, APITimeoutError, ConflictError, InternalServerError
+)
+
+# int8 candidates are re-scored against the original vectors; oversampling
+# fetches extra candidates to make up for quantization error
+SEARCH_PARAMS = SearchParams(
+    quantization=QuantizationSearchParams(rescore=True, oversampling=2.0)
+)
+
+# Payload fields read by _format_results (LangChain and legacy format)
+SEARCH_PAYLOAD_FIELDS = [
+    "page_content", "metadata",
+    "text", "filename", "source", "chunk_index", "file_type", "doc_id"
+]
+
+# How long a doc_id seen by this process answers /upload duplicate checks
+# locally; other processes may add or delete documents in the meantime
+KNOWN_ID_TTL_SECONDS = 300.0
+KNOWN_ID_CACHE_SIZE = 10000
+
+# How long an empty-collection result is trusted before asking Qdrant again
+EMPTY_RECHECK_SECONDS = 30.0
+
+# Recent query embeddings kept in memory (~12 KB each at 3072 dimensions)
+QUERY_EMBEDDING_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=1)
+def get_embeddings() -> OpenAIEmbeddings:
+    """Return the shared OpenAI embeddings client (one connection pool per process)."""
+    settings = get_settings()
+    # text-embedding-3-large by default (3072 dimensions)
+    return OpenAIEmbeddings(
+        openai_api_key=settings.openai_api_key,
+        model=settings.openai_embedding_model
+    )
+
+
+@lru_cache(maxsize=1)
+def get_embedding_cache() -> Optional[EmbeddingCache]:
+    """
+    Return the shared persistent query embedding cache.
+
+    Returns None (cached, so opening isn't retried per query) if the cache
+    database can't be opened; queries then only use the in-memory cache.
+    """
+    path = get_settings().embedding_cache_path
+    try:
+        return EmbeddingCache(path)
+    except (OSError, sqlite3.Error) as e:
+        logger.warning(f"Embedding cache unavailable at {path}, continuing without it: {e}")
+        return None
+
+
+@lru_cache(maxsize=1)
+def get_vector_store() -> "LangChainVectorStore":
+    """Return the process-wide vector store, initializing the collection once."""
+    return LangChainVectorStore()
+
+
+# In-memory LRU of query embeddings, shared by the sync and async search paths
+_query_vectors: "OrderedDict[str, array]" = OrderedDict()
+_query_vectors_lock = threading.Lock()
+
+
+def _remember_query_vector(query: str, vector: array) -> None:
+    """Keep a query embedding in memory, evicting the least recently used."""
+    with _query_vectors_lock:
+        _query_vectors[query] = vector
+        _query_vectors.move_to_end(query)
+        if len(_query_vectors) > QUERY_EMBEDDING_CACHE_SIZE:
+            _query_vectors.popitem(last=False)
+
+
+def _memory_query_vector(query: str) -> Optional[array]:
+    """Look a query embedding up in memory only."""
+    with _query_vectors_lock:
+        vector = _query_vectors.get(query)
+        if vector is not None:
+            _query_vectors.move_to_end(query)
+        return vector
+
+
+def _load_query_vector(query: str) -> Optional[array]:
+    """Look a query embedding up in the persistent cache (SQLite, blocking)."""
+    # Persistent entries are keyed by (model, sha256(query))
+    cache = get_embedding_cache()
+    if cache is None:
+        return None
+
+    key = EmbeddingCache.make_key(query, get_settings().openai_embedding_model)
+    stored = cache.get(key)
+    if stored is None:
+        return None
+
+    # float32 array instead of a list of Python floats: ~8x smaller per entry
+    vector = array("f", stored)
+    _remember_query_vector(query, vector)
+    return vector
+
+
+def _cached_query_vector(query: str) -> Optional[array]:
+    """Look a query embedding up in memory, then in the persistent cache."""
+    vector = _memory_query_vector(query)
+    return vector if vector is not None else _load_query_vector(query)
+
+
+def _persist_query_vector(query: str, embedding: Sequence[float]) -> None:
+    """Write a query embedding to the persistent cache (SQLite, blocking)."""
+    cache = get_embedding_cache()
+    if cache is not None:
+        key = EmbeddingCache.make_key(query, get_settings().openai_embedding_model)
+        cache.set(key, embedding)
+
+
+def _store_query_vector(query: str, embedding: Sequence[float]) -> array:
+    """Cache a freshly computed query embedding in memory and on disk."""
+    _persist_query_vector(query, embedding)
+    vector = array("f", embedding)
+    _remember_query_vector(query, vector)
+    return vector
 
 
 class LangChainVectorStore:
     """Vector store operations using LangChain."""
 
-    # Class-level lock for preventing race conditions during document insertion
-    _doc_locks = {}
+    # Per-document locks preventing duplicate insertion; entries disappear
+    # once no thread holds a reference to the lock
+    _doc_locks: "WeakValueDictionary[str, threading.Lock]" = WeakValueDictionary()
     _locks_mutex = threading.Lock()
 
     def __init__(self):
+        settings = get_settings()
         self.collection_name = settings.qdrant_collection_name
+        self.vector_size = settings.qdrant_vector_size
+        self.upsert_batch_size = settings.qdrant_upsert_batch_size
+
+        # Bulk ingest mode pauses HNSW indexing while any ingestion is running
+        self.bulk_ingest_mode = settings.bulk_ingest_mode
+        self._bulk_mutex = threading.Lock()
+        self._bulk_ingestions = 0
+        self._indexing_threshold = DEFAULT_INDEXING_THRESHOLD
 
         # Initialize Qdrant client for direct operations (stats, indexed queries)
-        self.client = QdrantClient(
-            url=settings.qdrant_url,
-            api_key=settings.qdrant_api_key,
-            timeout=60
-        )
+        self.client = get_qdrant_client()
+        self.async_client = get_async_qdrant_client()
 
-        # Initialize OpenAI embeddings with text-embedding-3-large (3072 dimensions)
-        self.embeddings = OpenAIEmbeddings(
-            openai_api_key=settings.openai_api_key,
-            model=settings.openai_embedding_model
-        )
+        # Shared OpenAI embeddings client
+        self.embeddings = get_embeddings()
 
-        # Initialize LangChain Qdrant vector store
-        self.vector_store = Qdrant(
-            client=self.client,
-            collection_name=self.collection_name,
-            embeddings=self.embeddings
-        )
+        # Shared async OpenAI client; _aembed_batch retries rate limits and
+        # transient failures (EMBED_RETRYABLE_ERRORS) with jittered backoff
+        self.embedding_model = settings.openai_embedding_model
+        self.async_openai = get_async_openai_client().with_options(max_retries=0)
+
+        # Concurrent query embeddings are coalesced into one request
+        self._query_batcher = AsyncEmbeddingBatcher(self._aembed_batch)
+
+        # Background writes of new query embeddings to the persistent cache
+        self._cache_writes: Set[asyncio.Future] = set()
+
+        # Set once legacy top-level doc_ids have been copied to metadata.doc_id
+        self._legacy_migrated = False
+
+        try:
+            self._initialize_collection()
+        except Exception:
+            # Already logged; keep serving so /health can report the outage
+            pass
+
+        # doc_ids recently stored or found by this process (doc_id -> monotonic
+        # time seen); only a fast path for /upload, never the final check
+        self._known_ids: "OrderedDict[str, float]" = OrderedDict()
+        self._known_ids_lock = threading.Lock()
+
+        # doc_ids currently being ingested by aadd_documents
+        self._ingesting: Set[str] = set()
+
+        # Once points are known to exist, searches skip the emptiness check
+        self._nonempty = False
+        self._empty_checked_at = float("-inf")
 
     @classmethod
     def _get_doc_lock(cls, doc_id: str) -> threading.Lock:
         """Get or create a lock for a specific document ID."""
-        with cls._locks_mutex:
-            if doc_id not in cls._doc_locks:
-                cls._doc_locks[doc_id] = threading.Lock()
-            return cls._doc_locks[doc_id]
+        lock = cls._doc_locks.get(doc_id)
+        if lock is None:
+            # WeakValueDictionary.setdefault isn't atomic, so creation stays
+            # under the mutex; lookups of live locks skip it
+            with cls._locks_mutex:
+                lock = cls._doc_locks.setdefault(doc_id, threading.Lock())
+        return lock
 
     def _initialize_collection(self):
         """Create collection if it doesn't exist."""
@@ -62,26 +251,133 @@ class LangChainVectorStore:
             if self.collection_name not in collection_names:
                 self.client.create_collection(
                     collection_name=self.collection_name,
-                    vectors_config=VectorParams(size=self.vector_size, distance=Distance.COSINE)
+                    # Originals stay on disk and are only read to rescore candidates
+                    vectors_config=VectorParams(size=self.vector_size, distance=Distance.COSINE, on_disk=True),
+                    # int8 copies in RAM: 4x smaller and faster to compare than float32
+                    quantization_config=ScalarQuantization(
+                        scalar=ScalarQuantizationConfig(type=ScalarType.INT8, quantile=0.99, always_ram=True)
+                    )
                 )
                 logger.info(f"Created collection: {self.collection_name}")
             else:
                 logger.info(f"Collection already exists: {self.collection_name}")
+
+            # Keyword indexes so doc_id filters don't scan every point
+            payload_schema = self.client.get_collection(self.collection_name).payload_schema
+            for field in DOC_ID_FIELDS:
+                if field not in payload_schema:
+                    self.client.create_payload_index(
+                        collection_name=self.collection_name,
+                        field_name=field,
+                        field_schema=PayloadSchemaType.KEYWORD
+                    )
+                    logger.info(f"Created payload index on {field}")
+
+            self._migrate_legacy_payloads()
         except Exception as e:
             logger.error(f"Error initializing collection: {e}")
             raise
 
-    def check_document_exists(self, doc_id: str) -> bool:
-        """Check if a document already exists in the vector store."""
+    def _migrate_legacy_payloads(self) -> None:
+        """
+        Copy legacy top-level doc_id values into metadata.doc_id.
+
+        Migrated points no longer match the legacy filter, so once every
+        point has been updated later startups find nothing to do.
+        """
+        legacy_filter = Filter(
+            must=[IsEmptyCondition(is_empty=PayloadField(key="metadata.doc_id"))],
+            must_not=[IsEmptyCondition(is_empty=PayloadField(key="doc_id"))]
+        )
+
+        migrated = set()
+        while True:
+            # Updated points drop out of the filter, so always read the first page
+            points, _ = self.client.scroll(
+                collection_name=self.collection_name,
+                scroll_filter=legacy_filter,
+                with_payload=["doc_id"],
+                with_vectors=False,
+                limit=1000
+            )
+            if not points:
+                break
+
+            doc_ids = {point.payload["doc_id"] for point in points}
+            if doc_ids <= migrated:
+                # Updates didn't take effect; keep the legacy lookup path
+                logger.warning("Legacy payload migration made no progress, stopping")
+                return
+
+            for doc_id in doc_ids:
+                # One update per document covers all of its chunks
+                self.client.set_payload(
+                    collection_name=self.collection_name,
+                    payload={"doc_id": doc_id},
+                    points=Filter(must=[FieldCondition(key="doc_id", match=MatchValue(value=doc_id))]),
+                    key="metadata",
+                    wait=True
+                )
+                migrated.add(doc_id)
+
+        if migrated:
+            logger.info(f"Migrated {len(migrated)} legacy documents to metadata.doc_id")
+        self._legacy_migrated = True
+
+    @staticmethod
+    def _payload_doc_id(payload: Optional[Dict[str, Any]]) -> Optional[str]:
+        """Read a point's doc_id: LangChain format first, then legacy top-level."""
+        payload = payload or {}
+        return (payload.get("metadata") or {}).get("doc_id") or payload.get("doc_id")
+
+    def _remember_doc_id(self, doc_id: str) -> None:
+        """Record that a doc_id is known to be stored, evicting expired entries."""
+        now = time.monotonic()
+        with self._known_ids_lock:
+            # Entries are kept oldest first, so expired ones sit at the front
+            self._known_ids[doc_id] = now
+            self._known_ids.move_to_end(doc_id)
+            while self._known_ids:
+                oldest_id, seen_at = next(iter(self._known_ids.items()))
+                if now - seen_at < KNOWN_ID_TTL_SECONDS and len(self._known_ids) <= KNOWN_ID_CACHE_SIZE:
+                    break
+                del self._known_ids[oldest_id]
+
+    def _forget_doc_id(self, doc_id: str) -> None:
+        """Drop a doc_id from the local record."""
+        with self._known_ids_lock:
+            self._known_ids.pop(doc_id, None)
+
+    def _recently_known(self, doc_id: str) -> bool:
+        """Whether this process stored or found doc_id within KNOWN_ID_TTL_SECONDS."""
+        with self._known_ids_lock:
+            seen_at = self._known_ids.get(doc_id)
+        return seen_at is not None and time.monotonic() - seen_at < KNOWN_ID_TTL_SECONDS
+
+    def check_document_exists(self, doc_id: str, use_local: bool = False) -> bool:
+        """
+        Check if a document already exists in the vector store.
+
+        Args:
+            doc_id: Document ID to look up
+            use_local: Accept a recent local record of the doc_id instead of
+                asking Qdrant (for early checks; ingestion always asks Qdrant)
+        """
         try:
             if not doc_id:
                 return False
 
-            # Check for metadata.doc_id (LangChain format - we have an index on this field)
+            if use_local and self._recently_known(doc_id):
+                logger.info(f"Document {doc_id} already exists in vector store")
+                return True
+
+            # Check for metadata.doc_id (LangChain format - we have an index on this field).
+            # Exact, because a filtered estimate is not 0 when the index is missing;
+            # with the index it is a cheap lookup that returns no points.
             try:
-                results, _ = self.client.scroll(
+                result = self.client.count(
                     collection_name=self.collection_name,
-                    scroll_filter=Filter(
+                    count_filter=Filter(
                         must=[
                             FieldCondition(
                                 key="metadata.doc_id",
@@ -89,22 +385,26 @@ class LangChainVectorStore:
                             )
                         ]
                     ),
-                    limit=1,
-                    with_payload=False,
-                    with_vectors=False
+                    exact=True
                 )
 
-                if len(results) > 0:
+                if result.count > 0:
                     logger.info(f"Document {doc_id} already exists in vector store")
+                    self._remember_doc_id(doc_id)
                     return True
                     
             except Exception as metadata_exc:
+                if self._legacy_migrated:
+                    # Every point carries metadata.doc_id, so the legacy field can't help
+                    logger.warning(f"metadata.doc_id lookup failed: {metadata_exc}. Assuming document is new.")
+                    return False
+
                 # If metadata.doc_id lookup fails, try top-level doc_id (legacy format)
                 logger.warning(f"metadata.doc_id lookup failed: {metadata_exc}. Trying top-level doc_id...")
                 try:
-                    results, _ = self.client.scroll(
+                    result = self.client.count(
                         collection_name=self.collection_name,
-                        scroll_filter=Filter(
+                        count_filter=Filter(
                             must=[
                                 FieldCondition(
                                     key="doc_id",
@@ -112,13 +412,12 @@ class LangChainVectorStore:
                                 )
                             ]
                         ),
-                        limit=1,
-                        with_payload=False,
-                        with_vectors=False
+                        exact=True
                     )
 
-                    if len(results) > 0:
+                    if result.count > 0:
                         logger.info(f"Document {doc_id} already exists in vector store (legacy format)")
+                        self._remember_doc_id(doc_id)
                         return True
                         
                 except Exception as docid_exc:
@@ -131,13 +430,248 @@ class LangChainVectorStore:
             logger.error(f"Error checking document existence: {e}")
             return False
 
-    def add_documents(self, chunks: List[Dict[str, Any]]) -> bool:
-        """Add document chunks to vector store using LangChain with duplicate prevention."""
-        if not chunks:
+    def _existing_doc_ids(self, doc_ids: List[str]) -> Set[str]:
+        """
+        Return which of the given doc_ids are already stored.
+
+        One paged MatchAny scroll per doc_id field answers for the whole list
+        at once.
+        """
+        fields = ("metadata.doc_id",) if self._legacy_migrated else DOC_ID_FIELDS
+        existing = set()
+        try:
+            for field in fields:
+                offset = None
+                while True:
+                    points, offset = self.client.scroll(
+                        collection_name=self.collection_name,
+                        scroll_filter=Filter(must=[FieldCondition(key=field, match=MatchAny(any=doc_ids))]),
+                        with_payload=["metadata.doc_id", "doc_id"],
+                        with_vectors=False,
+                        limit=1000,
+                        offset=offset
+                    )
+                    existing.update(self._payload_doc_id(point.payload) for point in points)
+                    if offset is None:
+                        break
+        except Exception as e:
+            logger.error(f"Error checking document existence: {e}")
+
+        for doc_id in existing:
+            self._remember_doc_id(doc_id)
+        return existing
+
+    def _mark_stored(self, doc_id: str) -> None:
+        """Record that a document's chunks were upserted."""
+        self._remember_doc_id(doc_id)
+        self._nonempty = True
+
+    def _skip_search(self) -> bool:
+        """Whether the collection was found empty within EMPTY_RECHECK_SECONDS."""
+        return not self._nonempty and time.monotonic() - self._empty_checked_at < EMPTY_RECHECK_SECONDS
+
+    def _record_count(self, count: int) -> None:
+        """Cache the result of an emptiness check."""
+        self._nonempty = count > 0
+        self._empty_checked_at = time.monotonic()
+
+    def _is_empty(self) -> bool:
+        """Return True if the collection has no points, asking Qdrant at most once per TTL."""
+        if self._nonempty:
+            return False
+        if self._skip_search():
+            return True
+        try:
+            self._record_count(self.client.count(collection_name=self.collection_name, exact=False).count)
+        except Exception as e:
+            logger.warning(f"Could not count points, searching anyway: {e}")
+            return False
+        return not self._nonempty
+
+    async def _ais_empty(self) -> bool:
+        """Async counterpart of _is_empty."""
+        if self._nonempty:
+            return False
+        if self._skip_search():
+            return True
+        try:
+            result = await self.async_client.count(collection_name=self.collection_name, exact=False)
+            self._record_count(result.count)
+        except Exception as e:
+            logger.warning(f"Could not count points, searching anyway: {e}")
+            return False
+        return not self._nonempty
+
+    @staticmethod
+    def _build_batch(
+        vectors: List[List[float]], texts: List[str], metadatas: List[Dict[str, Any]]
+    ) -> Batch:
+        """Build a columnar upsert batch in LangChain's payload format."""
+        # Column lists instead of one PointStruct per chunk; Qdrant accepts
+        # the 32-char hex form of a UUID as a point ID
+        return Batch(
+            ids=[uuid.uuid4().hex for _ in texts],
+            vectors=vectors,
+            payloads=[{"page_content": text, "metadata": metadata} for text, metadata in zip(texts, metadatas)]
+        )
+
+    def _embed_and_upsert(self, texts: List[str], metadatas: List[Dict[str, Any]]) -> None:
+        """Embed one sub-batch of chunks and upsert it."""
+        vectors = self.embeddings.embed_documents(texts)
+        points = self._build_batch(vectors, texts, metadatas)
+        self.client.upsert(collection_name=self.collection_name, points=points, wait=False)
+
+    async def _aembed_batch(self, texts: List[str]) -> np.ndarray:
+        """Embed texts in one request, backing off on rate limits and transient errors."""
+        for attempt in range(EMBED_MAX_ATTEMPTS):
+            try:
+                # base64 responses decode straight to float32 rows, with no
+                # per-float Python objects along the way
+                response = await self.async_openai.embeddings.create(
+                    model=self.embedding_model, input=texts, encoding_format="base64"
+                )
+                # Results come back in input order
+                return np.stack([
+                    np.frombuffer(base64.b64decode(item.embedding), dtype=np.float32)
+                    for item in response.data
+                ])
+            except EMBED_RETRYABLE_ERRORS as e:
+                if attempt == EMBED_MAX_ATTEMPTS - 1:
+                    raise
+                # Exponential backoff with full jitter so concurrent batches don't retry in lockstep
+                delay = random.uniform(0, 2 ** attempt)
+                logger.warning(f"Embedding request failed ({type(e).__name__}), retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+
+    async def _aupsert(
+        self,
+        vectors: np.ndarray,
+        texts: List[str],
+        metadatas: List[Dict[str, Any]],
+        semaphore: asyncio.Semaphore
+    ) -> None:
+        """Upsert one group of points without waiting for indexing."""
+        async with semaphore:
+            # Expand to Python lists only once a slot is free: pydantic validates
+            # lists ~30x faster than ndarrays, and waiting groups stay float32
+            points = self._build_batch(vectors.tolist(), texts, metadatas)
+            await self.async_client.upsert(collection_name=self.collection_name, points=points, wait=False)
+
+    async def _aembed_and_upsert(
+        self,
+        texts: List[str],
+        metadatas: List[Dict[str, Any]],
+        embed_semaphore: asyncio.Semaphore,
+        upsert_semaphore: asyncio.Semaphore
+    ) -> None:
+        """Embed one sub-batch, then upsert it in concurrent groups of upsert_batch_size."""
+        async with embed_semaphore:
+            vectors = await self._aembed_batch(texts)
+
+        size = self.upsert_batch_size
+        await asyncio.gather(*(
+            self._aupsert(
+                vectors[start:start + size], texts[start:start + size], metadatas[start:start + size],
+                upsert_semaphore
+            )
+            for start in range(0, len(texts), size)
+        ))
+
+    def _pause_indexing(self) -> bool:
+        """
+        Register a bulk ingestion, disabling indexing if it is the first one.
+
+        Returns:
+            True if the ingestion was registered and must call _resume_indexing
+        """
+        with self._bulk_mutex:
+            try:
+                if self._bulk_ingestions == 0:
+                    info = self.client.get_collection(self.collection_name)
+                    self._indexing_threshold = (
+                        info.config.optimizer_config.indexing_threshold or DEFAULT_INDEXING_THRESHOLD
+                    )
+                    self.client.update_collection(
+                        collection_name=self.collection_name,
+                        optimizer_config=OptimizersConfigDiff(indexing_threshold=0)
+                    )
+                    logger.info("Paused HNSW indexing for bulk ingestion")
+            except Exception as e:
+                logger.warning(f"Could not pause indexing, ingesting with indexing enabled: {e}")
+                return False
+
+            self._bulk_ingestions += 1
+            return True
+
+    def _resume_indexing(self) -> None:
+        """Unregister a bulk ingestion, restoring indexing after the last one."""
+        with self._bulk_mutex:
+            self._bulk_ingestions -= 1
+            if self._bulk_ingestions == 0:
+                try:
+                    self.client.update_collection(
+                        collection_name=self.collection_name,
+                        optimizer_config=OptimizersConfigDiff(indexing_threshold=self._indexing_threshold)
+                    )
+                    logger.info(f"Resumed HNSW indexing (threshold {self._indexing_threshold})")
+                except Exception as e:
+                    logger.error(f"Could not resume indexing: {e}")
+
+    @contextmanager
+    def _bulk_ingest(self):
+        """Pause indexing around a block of upserts when bulk ingest mode is on."""
+        paused = self.bulk_ingest_mode and self._pause_indexing()
+        try:
+            yield
+        finally:
+            if paused:
+                self._resume_indexing()
+
+    def _embed_and_upsert_all(self, texts: List[str], metadatas: List[Dict[str, Any]]) -> None:
+        """Embed and upsert chunks in sub-batches on a thread pool."""
+        with self._bulk_ingest(), ThreadPoolExecutor(max_workers=EMBED_CONCURRENCY) as executor:
+            futures = [
+                executor.submit(
+                    self._embed_and_upsert,
+                    texts[start:start + EMBED_BATCH_SIZE],
+                    metadatas[start:start + EMBED_BATCH_SIZE]
+                )
+                for start in range(0, len(texts), EMBED_BATCH_SIZE)
+            ]
+            for future in futures:
+                future.result()
+
+    async def _aembed_and_upsert_all(self, texts: List[str], metadatas: List[Dict[str, Any]]) -> None:
+        """Embed and upsert chunks in concurrent sub-batches on the event loop."""
+        embed_semaphore = asyncio.Semaphore(EMBED_CONCURRENCY)
+        upsert_semaphore = asyncio.Semaphore(UPSERT_CONCURRENCY)
+        paused = self.bulk_ingest_mode and await asyncio.to_thread(self._pause_indexing)
+        try:
+            await asyncio.gather(*(
+                self._aembed_and_upsert(
+                    texts[start:start + EMBED_BATCH_SIZE],
+                    metadatas[start:start + EMBED_BATCH_SIZE],
+                    embed_semaphore,
+                    upsert_semaphore
+                )
+                for start in range(0, len(texts), EMBED_BATCH_SIZE)
+            ))
+        finally:
+            if paused:
+                await asyncio.to_thread(self._resume_indexing)
+
+    def add_documents(self, batch: ChunkBatch) -> bool:
+        """
+        Add document chunks to the vector store with duplicate prevention.
+
+        Chunks are embedded and upserted in sub-batches of EMBED_BATCH_SIZE,
+        with up to EMBED_CONCURRENCY sub-batches in flight at once.
+        """
+        if not batch:
             logger.warning("No chunks to add")
             return False
 
-        doc_id = chunks[0]["metadata"]["doc_id"]
+        doc_id = batch.doc_id
 
         # Acquire lock for this document to prevent race conditions
         doc_lock = self._get_doc_lock(doc_id)
@@ -149,25 +683,210 @@ class LangChainVectorStore:
                 return False
 
             try:
-                texts = [chunk["text"] for chunk in chunks]
-                metadatas = [chunk["metadata"] for chunk in chunks]
+                self._embed_and_upsert_all(batch.texts, batch.metadatas)
 
-                # Add doc_id at top level for all chunks (for indexed duplicate detection)
-                for metadata in metadatas:
-                    metadata["doc_id"] = doc_id
+                self._mark_stored(doc_id)
 
-                self.vector_store.add_texts(
-                    texts=texts,
-                    metadatas=metadatas
-                )
-
-                logger.info(f"Added {len(chunks)} chunks for document {doc_id}")
+                logger.info(f"Added {len(batch)} chunks for document {doc_id}")
                 return True
 
             except Exception as e:
                 logger.error(f"Error adding documents: {e}")
                 return False
 
+    def add_documents_batch(self, batches: List[ChunkBatch]) -> Dict[str, bool]:
+        """
+        Add several documents at once with duplicate prevention.
+
+        Chunks of all new documents are pooled before being split into
+        sub-batches, so many small documents share embedding requests and
+        upserts instead of each paying for its own.
+
+        Args:
+            batches: One ChunkBatch per document
+
+        Returns:
+            Dict mapping each doc_id to whether its chunks were added
+        """
+        results = {batch.doc_id: False for batch in batches}
+        # Keyed by doc_id, so a document listed twice is only added once
+        pending = {batch.doc_id: batch for batch in batches if batch}
+
+        with ExitStack() as stack:
+            # Lock in a fixed order so concurrent batch calls can't deadlock
+            for doc_id in sorted(pending):
+                stack.enter_context(self._get_doc_lock(doc_id))
+
+            existing = self._existing_doc_ids(list(pending))
+            new_batches = []
+            for doc_id, batch in pending.items():
+                if doc_id in existing:
+                    logger.warning(f"Skipping duplicate document: {doc_id}")
+                else:
+                    new_batches.append(batch)
+
+            if not new_batches:
+                return results
+
+            try:
+                self._embed_and_upsert_all(
+                    [text for batch in new_batches for text in batch.texts],
+                    [metadata for batch in new_batches for metadata in batch.metadatas]
+                )
+            except Exception as e:
+                logger.error(f"Error adding documents: {e}")
+                return results
+
+            for batch in new_batches:
+                results[batch.doc_id] = True
+                self._mark_stored(batch.doc_id)
+
+            logger.info(
+                f"Added {sum(len(batch) for batch in new_batches)} chunks "
+                f"for {len(new_batches)} documents"
+            )
+            return results
+
+    async def aadd_documents(self, batch: ChunkBatch) -> bool:
+        """
+        Async variant of add_documents for use on the event loop.
+
+        Sub-batches are embedded concurrently (at most EMBED_CONCURRENCY
+        requests in flight) and upserted in groups of upsert_batch_size (at
+        most UPSERT_CONCURRENCY requests in flight).
+        """
+        if not batch:
+            logger.warning("No chunks to add")
+            return False
+
+        doc_id = batch.doc_id
+
+        # Everything runs on one event loop, so this check-and-mark can't interleave
+        if doc_id in self._ingesting:
+            logger.warning(f"Skipping duplicate document: {doc_id}")
+            return False
+        self._ingesting.add(doc_id)
+
+        try:
+            if await asyncio.to_thread(self.check_document_exists, doc_id):
+                logger.warning(f"Skipping duplicate document: {doc_id}")
+                return False
+
+            await self._aembed_and_upsert_all(batch.texts, batch.metadatas)
+
+            self._mark_stored(doc_id)
+
+            logger.info(f"Added {len(batch)} chunks for document {doc_id}")
+            return True
+
+        except Exception as e:
+            logger.error(f"Error adding documents: {e}")
+            return False
+        finally:
+            self._ingesting.discard(doc_id)
+
+    async def aadd_documents_batch(self, batches: List[ChunkBatch]) -> Dict[str, bool]:
+        """
+        Async variant of add_documents_batch for use on the event loop.
+
+        Chunks of all new documents go through one embedding/upsert pipeline,
+        so sub-batches span document boundaries and run concurrently.
+
+        Args:
+            batches: One ChunkBatch per document
+
+        Returns:
+            Dict mapping each doc_id to whether its chunks were added
+        """
+        results = {batch.doc_id: False for batch in batches}
+        # Documents already being ingested elsewhere on this loop are skipped
+        pending = {
+            batch.doc_id: batch for batch in batches
+            if batch and batch.doc_id not in self._ingesting
+        }
+        if not pending:
+            return results
+        self._ingesting.update(pending)
+
+        try:
+            existing = await asyncio.to_thread(self._existing_doc_ids, list(pending))
+            new_batches = []
+            for doc_id, batch in pending.items():
+                if doc_id in existing:
+                    logger.warning(f"Skipping duplicate document: {doc_id}")
+                else:
+                    new_batches.append(batch)
+
+            if not new_batches:
+                return results
+
+            await self._aembed_and_upsert_all(
+                [text for batch in new_batches for text in batch.texts],
+                [metadata for batch in new_batches for metadata in batch.metadatas]
+            )
+
+            for batch in new_batches:
+                results[batch.doc_id] = True
+                self._mark_stored(batch.doc_id)
+
+            logger.info(
+                f"Added {sum(len(batch) for batch in new_batches)} chunks "
+                f"for {len(new_batches)} documents"
+            )
+            return results
+
+        except Exception as e:
+            logger.error(f"Error adding documents: {e}")
+            return results
+        finally:
+            self._ingesting.difference_update(pending)
+
+    def delete_documents(self, doc_id: str) -> None:
+        """
+        Delete all chunks of a document.
+
+        Args:
+            doc_id: Document ID to delete
+        """
+        # Both doc_id fields are keyword-indexed, so the filter doesn't scan the collection
+        fields = ("metadata.doc_id",) if self._legacy_migrated else DOC_ID_FIELDS
+        self.client.delete(
+            collection_name=self.collection_name,
+            points_selector=FilterSelector(
+                filter=Filter(should=[
+                    FieldCondition(key=field, match=MatchValue(value=doc_id))
+                    for field in fields
+                ])
+            ),
+            wait=True
+        )
+
+        self._forget_doc_id(doc_id)
+
+        # The collection may be empty now; the next search checks again
+        self._nonempty = False
+        self._empty_checked_at = float("-inf")
+
+        logger.info(f"Deleted document {doc_id}")
+
+    async def aclose(self) -> None:
+        """
+        Stop the query batcher and close the async Qdrant and HTTP pools.
+
+        The store and anything else holding the async clients (e.g. an
+        OpenAIGenerator) must not be used afterwards; get_vector_store()
+        returns a new store with fresh clients.
+        """
+        await self._query_batcher.aclose()
+        await self.async_client.close()
+        await get_async_http_client().aclose()
+
+        # Closed clients can't be reused; the next caller gets fresh ones
+        get_vector_store.cache_clear()
+        get_async_qdrant_client.cache_clear()
+        get_async_openai_client.cache_clear()
+        get_async_http_client.cache_clear()
+
     def search(self, query: str, k: int = 5) -> List[Dict[str, Any]]:
         """Search for similar documents using direct Qdrant client."""
         try:
@@ -179,47 +898,107 @@ class LangChainVectorStore:
             logger.error(f"Error searching: {e}")
             return []
 
+    def _embed_query(self, query: str) -> List[float]:
+        """Embed a search query, reusing cached vectors for repeated queries."""
+        vector = _cached_query_vector(query)
+        if vector is None:
+            vector = _store_query_vector(query, self.embeddings.embed_query(query))
+        return vector.tolist()
+
+    async def _aembed_query(self, query: str) -> List[float]:
+        """Async counterpart of _embed_query; SQLite cache work runs off the event loop."""
+        vector = _memory_query_vector(query)
+        if vector is None:
+            vector = await asyncio.to_thread(_load_query_vector, query)
+        if vector is None:
+            embedding = await self._query_batcher.submit(query)
+            vector = array("f", embedding)
+            _remember_query_vector(query, vector)
+            # The disk write commits (fsync), so don't make the caller wait for it
+            write = asyncio.get_running_loop().run_in_executor(None, _persist_query_vector, query, embedding)
+            self._cache_writes.add(write)
+            write.add_done_callback(self._cache_write_done)
+        return vector.tolist()
+
+    def _cache_write_done(self, write: asyncio.Future) -> None:
+        """Forget a finished background cache write, logging any failure."""
+        self._cache_writes.discard(write)
+        if not write.cancelled() and write.exception() is not None:
+            logger.warning(f"Query embedding cache write failed: {write.exception()}")
+
     def search_with_scores(self, query: str, k: int = 5) -> List[Dict[str, Any]]:
         """Search with similarity scores using direct Qdrant client."""
         try:
-            # Generate query embedding
-            query_vector = self.embeddings.embed_query(query)
+            # Nothing to find, so skip the embedding call and the search
+            if self._is_empty():
+                return []
+
+            # Generate query embedding (cached for repeated queries)
+            query_vector = self._embed_query(query)
             
             # Search using Qdrant client directly
             search_results = self.client.search(
                 collection_name=self.collection_name,
                 query_vector=query_vector,
                 limit=k,
-                with_payload=True
+                search_params=SEARCH_PARAMS,
+                with_payload=SEARCH_PAYLOAD_FIELDS
             )
             
-            # Format results to match expected structure
-            formatted_results = []
-            for result in search_results:
-                payload = result.payload
-                # Handle old format (text, source, filename as top-level keys)
-                if 'text' in payload:
-                    formatted_results.append({
-                        "text": payload.get('text', ''),
-                        "metadata": {
-                            "filename": payload.get('filename', 'Unknown'),
-                            "source": payload.get('source', 'Unknown'),
-                            "chunk_index": payload.get('chunk_index', 0),
-                            "file_type": payload.get('file_type', ''),
-                            "doc_id": payload.get('doc_id', '')
-                        },
-                        "score": result.score
-                    })
-                # Handle new LangChain format (page_content + metadata)
-                elif 'page_content' in payload:
-                    formatted_results.append({
-                        "text": payload.get('page_content', ''),
-                        "metadata": payload.get('metadata', {}),
-                        "score": result.score
-                    })
+            return self._format_results(search_results)
+
+        except Exception as e:
+            logger.error(f"Error searching with scores: {e}")
+            return []
+
+    async def asearch_with_scores(self, query: str, k: int = 5) -> List[Dict[str, Any]]:
+        """Search with similarity scores using the async OpenAI and Qdrant clients."""
+        try:
+            if await self._ais_empty():
+                return []
+
+            query_vector = await self._aembed_query(query)
+            
+            search_results = await self.async_client.search(
+                collection_name=self.collection_name,
+                query_vector=query_vector,
+                limit=k,
+                search_params=SEARCH_PARAMS,
+                with_payload=SEARCH_PAYLOAD_FIELDS
+            )
             
-            return formatted_results
+            return self._format_results(search_results)
 
         except Exception as e:
             logger.error(f"Error searching with scores: {e}")
             return []
+
+    @staticmethod
+    def _format_results(search_results: list) -> List[Dict[str, Any]]:
+        """Convert scored points to text/metadata/score dicts for both payload formats."""
+        # Format results to match expected structure
+        formatted_results = []
+        for result in search_results:
+            payload = result.payload
+            # Handle old format (text, source, filename as top-level keys)
+            if 'text' in payload:
+                formatted_results.append({
+                    "text": payload.get('text', ''),
+                    "metadata": {
+                        "filename": payload.get('filename', 'Unknown'),
+                        "source": payload.get('source', 'Unknown'),
+                        "chunk_index": payload.get('chunk_index', 0),
+                        "file_type": payload.get('file_type', ''),
+                        "doc_id": payload.get('doc_id', '')
+                    },
+                    "score": result.score
+                })
+            # Handle new LangChain format (page_content + metadata)
+            elif 'page_content' in payload:
+                formatted_results.append({
+                    "text": payload.get('page_content', ''),
+                    "metadata": payload.get('metadata', {}),
+                    "score": result.score
+                })
+
+        return formatted_results
@@ -2,7 +2,7 @@
 RAG Pipeline orchestrator that combines retrieval and generation.
 """
 
-from typing import Dict, Any, Optional
+from typing import AsyncIterator, Dict, Any, List, Optional
 from loguru import logger
 from src.retrieval.retriever import Retriever
 from src.generation.openai_generator import OpenAIGenerator
@@ -42,23 +42,55 @@ class RAGPipeline:
         """
         logger.info(f"Processing RAG query: '{question[:100]}...'")
         
-        # Step 1: Retrieve relevant context
-        context = self.retriever.get_context_for_generation(
+        # Step 1: Retrieve documents once; context and sources both come from them
+        documents, context = self.retriever.retrieve_and_format(question, top_k)
+        
+        # Step 2: Generate answer using OpenAI
+        response = self.generator.generate(
             query=question,
-            top_k=top_k
+            context=context,
+            system_prompt=system_prompt
         )
         
-        # Step 2: Retrieve raw documents for source information
-        documents = self.retriever.retrieve(question, top_k)
+        # Step 3: Compile sources
+        return self._build_result(question, documents, response)
+    
+    async def aquery(
+        self,
+        question: str,
+        top_k: Optional[int] = None,
+        system_prompt: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Execute RAG pipeline on the event loop using the async clients.
+        
+        Args:
+            question: User question
+            top_k: Number of documents to retrieve
+            system_prompt: Optional system prompt override
+            
+        Returns:
+            Dict with answer, sources, and metadata
+        """
+        logger.info(f"Processing RAG query: '{question[:100]}...'")
         
-        # Step 3: Generate answer using OpenAI
-        response = self.generator.generate(
+        documents, context = await self.retriever.aretrieve_and_format(question, top_k)
+        
+        response = await self.generator.agenerate(
             query=question,
             context=context,
             system_prompt=system_prompt
         )
         
-        # Step 4: Compile sources
+        return self._build_result(question, documents, response)
+    
+    @staticmethod
+    def _build_result(
+        question: str,
+        documents: List[Dict[str, Any]],
+        response: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Combine the generated answer with source information."""
         sources = [
             {
                 "filename": doc['metadata'].get('filename', 'Unknown'),
@@ -109,3 +141,36 @@ class RAGPipeline:
             context=context,
             system_prompt=system_prompt
         )
+    
+    async def query_streaming_async(
+        self,
+        question: str,
+        top_k: Optional[int] = None,
+        system_prompt: Optional[str] = None
+    ) -> AsyncIterator[str]:
+        """
+        Execute RAG pipeline with a streaming response on the event loop.
+        
+        Retrieval and generation both use the async clients, so other
+        requests are served while this one waits.
+        
+        Args:
+            question: User question
+            top_k: Number of documents to retrieve
+            system_prompt: Optional system prompt override
+            
+        Yields:
+            Text chunks from streaming response
+        """
+        logger.info(f"Processing streaming RAG query: '{question[:100]}...'")
+        
+        # Retrieve context
+        _, context = await self.retriever.aretrieve_and_format(question, top_k)
+        
+        # Stream generation
+        async for chunk in self.generator.generate_streaming_async(
+            query=question,
+            context=context,
+            system_prompt=system_prompt
+        ):
+            yield chunk
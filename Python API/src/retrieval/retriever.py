@@ -2,10 +2,13 @@
 Retrieval module for finding relevant documents using LangChain.
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from loguru import logger
 from src.ingestion.langchain_vector_store import LangChainVectorStore
 
+# Per-document block of the generation context
+_CONTEXT_TEMPLATE = "[Document {idx} - {source} (Relevance: {score:.2f})]\n{text}\n"
+
 
 class Retriever:
     """Handles document retrieval from LangChain vector store."""
@@ -45,6 +48,26 @@ class Retriever:
         
         return results
     
+    async def aretrieve(
+        self,
+        query: str,
+        top_k: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Retrieve relevant documents without blocking the event loop.
+        
+        Args:
+            query: Search query
+            top_k: Number of documents to retrieve
+            
+        Returns:
+            List of relevant documents with metadata and scores
+        """
+        logger.info(f"Retrieving documents for query: '{query[:100]}...'")
+        
+        k = top_k if top_k else 5
+        return await self.vector_store.asearch_with_scores(query=query, k=k)
+    
     def get_context_for_generation(
         self,
         query: str,
@@ -60,19 +83,57 @@ class Retriever:
         Returns:
             Formatted context string
         """
+        _, context = self.retrieve_and_format(query, top_k)
+        return context
+    
+    def retrieve_and_format(
+        self,
+        query: str,
+        top_k: Optional[int] = None
+    ) -> Tuple[List[Dict[str, Any]], str]:
+        """
+        Retrieve documents once and format them as generation context.
+        
+        Args:
+            query: User query
+            top_k: Number of documents to retrieve
+            
+        Returns:
+            Tuple of (documents, formatted context string)
+        """
         documents = self.retrieve(query, top_k)
+        return documents, self.format_context(documents)
+    
+    async def aretrieve_and_format(
+        self,
+        query: str,
+        top_k: Optional[int] = None
+    ) -> Tuple[List[Dict[str, Any]], str]:
+        """Async counterpart of retrieve_and_format."""
+        documents = await self.aretrieve(query, top_k)
+        return documents, self.format_context(documents)
+    
+    @staticmethod
+    def format_context(documents: List[Dict[str, Any]]) -> str:
+        """
+        Format retrieved documents as context for LLM generation.
         
+        Args:
+            documents: Documents returned by retrieve()
+            
+        Returns:
+            Formatted context string
+        """
         if not documents:
             return "No relevant documents found in the knowledge base."
         
-        # Format context
-        context_parts = []
-        for idx, doc in enumerate(documents, 1):
-            source = doc['metadata'].get('filename', 'Unknown')
-            text = doc['text']
-            score = doc.get('score', 0)
-            context_parts.append(
-                f"[Document {idx} - {source} (Relevance: {score:.2f})]\n{text}\n"
+        format_document = _CONTEXT_TEMPLATE.format
+        return "\n---\n".join(
+            format_document(
+                idx=idx,
+                source=doc['metadata'].get('filename', 'Unknown'),
+                score=doc.get('score', 0),
+                text=doc['text']
             )
-        
-        return "\n---\n".join(context_parts)
+            for idx, doc in enumerate(documents, 1)
+        )
@@ -6,9 +6,9 @@ import asyncio
 from pathlib import Path
 from loguru import logger
 
-from config.settings import settings
+from config.settings import get_settings
 from src.ingestion.langchain_processor import LangChainDocumentProcessor
-from src.ingestion.langchain_vector_store import LangChainVectorStore
+from src.ingestion.langchain_vector_store import get_vector_store
 from src.retrieval.retriever import Retriever
 from src.generation.openai_generator import OpenAIGenerator
 from src.rag_pipeline import RAGPipeline
@@ -18,10 +18,11 @@ async def test_pipeline():
     """Test the RAG pipeline with sample data."""
     
     logger.info("Starting RAG pipeline test with LangChain")
+    settings = get_settings()
     
     # Initialize components
     logger.info("Initializing LangChain components...")
-    vector_store = LangChainVectorStore()
+    vector_store = get_vector_store()
     retriever = Retriever(vector_store)
     generator = OpenAIGenerator()
     pipeline = RAGPipeline(retriever, generator)
@@ -39,19 +40,18 @@ async def test_pipeline():
         logger.info("\n=== Test 2: Document Processing ===")
         processor = LangChainDocumentProcessor(
             chunk_size=settings.chunk_size,
-            chunk_overlap=settings.chunk_overlap
+            chunk_overlap=settings.chunk_overlap,
+            hash_algorithm=settings.doc_hash_algorithm
         )
         
         for doc_path in sample_docs[:1]:  # Test with first document
             logger.info(f"Processing: {doc_path.name}")
             with open(doc_path, 'rb') as f:
-                file_content = f.read()
-            
-            chunks = processor.process_upload(doc_path.name, file_content)
-            logger.info(f"Created {len(chunks)} chunks")
+                batch = processor.process_upload(doc_path.name, f)
+            logger.info(f"Created {len(batch)} chunks")
             
             # Add to vector store
-            vector_store.add_documents(chunks)
+            await vector_store.aadd_documents(batch)
             logger.info("Added to vector store")
     
     # Test 3: Query the pipeline
@@ -70,6 +70,7 @@ async def test_pipeline():
     else:
         logger.warning("No documents in vector store. Add documents to test queries.")
     
+    await vector_store.aclose()
     logger.info("\n=== Test Complete ===")
 
 